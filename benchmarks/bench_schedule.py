@@ -0,0 +1,177 @@
+"""
+Benchmark building a team schedule from its season and game by game pages.
+
+Compares NCAA._build_schedule with the row loop it replaced, which scanned the
+whole season page for images twice per game row and re-ran row.find_all('td')
+three times. Both must return the same DataFrame.
+
+Usage:
+    python benchmarks/bench_schedule.py [SEASON_PAGE GAME_BY_GAME_PAGE] [--repeat N]
+
+Without pages, a synthetic season page (41 images, 2000 filler blocks) and a
+60-game game by game table are used.
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fetch_ncaa import NCAA  # noqa: E402
+from html_parsing import make_soup  # noqa: E402
+
+URL = "https://stats.ncaa.org/teams/1042"
+
+
+def synthetic_pages(games=60, images=41, filler=2000):
+    """
+    Return (season page, game by game page) HTML shaped like stats.ncaa.org's
+    """
+    logos = ''.join(f'<img src="//logos/{i}.gif">' for i in range(images))
+    blocks = ''.join(f'<div class="card"><span>Stat {i}</span><p>{i * 3}</p></div>' for i in range(filler))
+    season = f'<html><body><img src="//a/ncaa.png"><img src="//42.gif">{logos}{blocks}</body></html>'
+
+    rows = []
+    for game in range(games):
+        contest = 6000000 + game
+        date = f"{9 + game // 30:02d}/{1 + game % 28:02d}/2024"
+        if game % 10 == 9:
+            opponent = '@ Paul Smiths\n extra'
+        else:
+            prefix = '@ ' if game % 2 else ''
+            opponent = (f'{prefix}<a href="/teams/{7000 + game}"><img src="//{100 + game}.gif" height="20" width="20" '
+                        f'alt="Opponent {game}">#{game % 25 + 1} Opponent {game}</a>')
+        rows.append(f'<tr id="contest_{contest}"><td>{date}</td><td>{opponent}</td><td>W 3-{game % 3}</td></tr>')
+        rows.append(f'<tr id="contest_{contest}_defense"><td></td><td>Defensive Totals</td><td></td></tr>')
+    gbg = f'<html><body><table>{"".join(rows)}</table></body></html>'
+    return season, gbg
+
+
+def legacy_build_schedule(soup, gbg_soup, url, teams):
+    """
+    The game by game row loop as it was before the per-page values were hoisted
+    """
+    game_rows = gbg_soup.find_all('tr', id=re.compile(r'^contest_\d+'))
+    data = []
+    for row in game_rows:
+        match_id = row['id'].replace('contest_', '')
+        match_id = match_id.replace('_defense', '')
+
+        date = row.find('td').text.strip()
+
+        team_img = soup.find_all('img')[1]['src'] if len(soup.find_all('img')) > 1 else ""
+        team_id = team_img.split('//')[-1].replace(".gif", '') if team_img else ""
+
+        opponent_cell = row.find_all('td')[1]
+        opponent_text = opponent_cell.text.strip()
+
+        if '@' in opponent_text:
+            location = 'away'
+        elif '2024 NCAA' in opponent_text:
+            location = 'NCAA'
+        else:
+            location = 'home'
+
+        opponent_link = None
+        for a_tag in opponent_cell.find_all('a'):
+            img_tag = a_tag.find('img')
+            if img_tag and img_tag.has_attr('height') and img_tag.has_attr('width'):
+                opponent_link = a_tag
+                break
+
+        opponent_name = "Unknown"
+        opponent_img = ""
+        opponent_id = ""
+        opponent_season_id = ""
+
+        if opponent_link:
+            img_tag = opponent_link.find('img')
+            if img_tag:
+                opponent_img = img_tag['src']
+                opponent_id = opponent_img.split('//')[-1].replace('.gif', '')
+
+                opponent_name_parts = []
+                for content in opponent_link.contents:
+                    if not isinstance(content, str) and content.name == 'img':
+                        continue
+                    opponent_name_parts.append(str(content).strip())
+                opponent_name = ' '.join(opponent_name_parts).strip()
+
+                if not opponent_name and img_tag.get('alt'):
+                    opponent_name = img_tag['alt']
+
+                opponent_name = re.sub(r'^#\d+\s+', '', opponent_name)
+
+            opponent_season_id = opponent_link['href'].split('/')[-1]
+        else:
+            opponent_name = opponent_text.split('\n')[0].strip()
+            if '@' in opponent_name:
+                opponent_name = opponent_name.split('@')[1].strip()
+
+            opponent_name = re.sub(r'^#\d+\s+', '', opponent_name)
+
+        result_cell = row.find_all('td')[2]
+        result = result_cell.text.strip() if result_cell else ""
+
+        data.append({
+            'match_id': match_id,
+            'date': date,
+            'team_id': team_id,
+            'opponent_name': opponent_name,
+            'opponent_id': opponent_id,
+            'team_season_id': url.split('/')[-1],
+            'team_img': team_img,
+            'opponent_season_id': opponent_season_id,
+            'opponent_img': opponent_img,
+            'location': location,
+            'result': result
+        })
+
+    df = pd.DataFrame(data)
+
+    df = pd.merge(df, teams, left_on='team_id', right_on='orgId', how='left')
+    df = pd.merge(df, teams[['orgId', 'nameOfficial', 'divisionRoman', 'conferenceName']].rename(columns={'orgId': 'opponent_id', 'nameOfficial': 'oppNameOfficial', 'divisionRoman': "oppDivision", 'conferenceName': 'oppConference'}), how='left')
+    df = df[df['opponent_name'] != 'Defensive Totals']
+    df = df[df['date'] != '']
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('pages', nargs='*', help='Saved season page and game by game page')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs of each implementation')
+    args = parser.parse_args()
+
+    if len(args.pages) == 2:
+        season, gbg = (open(path, encoding='utf-8').read() for path in args.pages)
+    elif not args.pages:
+        season, gbg = synthetic_pages()
+    else:
+        parser.error('pass both the season page and the game by game page, or neither')
+
+    soup, gbg_soup = make_soup(season), make_soup(gbg)
+    teams = pd.DataFrame({
+        'orgId': ['42'], 'nameOfficial': ['Home University'], 'divisionRoman': ['I'], 'conferenceName': ['Big Ten'],
+    })
+    ncaa = NCAA('W', reference=object())
+
+    before = legacy_build_schedule(soup, gbg_soup, URL, teams)
+    after = ncaa._build_schedule(soup, gbg_soup, URL, teams)
+    pd.testing.assert_frame_equal(before, after)
+
+    timings = {
+        'before': timeit.timeit(lambda: legacy_build_schedule(soup, gbg_soup, URL, teams), number=args.repeat),
+        'after': timeit.timeit(lambda: ncaa._build_schedule(soup, gbg_soup, URL, teams), number=args.repeat),
+    }
+    print(f"{len(after)} games, {len(soup.find_all('img'))} images on the season page")
+    for name, seconds in timings.items():
+        print(f"{name:>6}: {seconds / args.repeat * 1000:.1f} ms per team")
+    print(f"speedup: {timings['before'] / timings['after']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
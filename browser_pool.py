@@ -0,0 +1,193 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+
+# selenium and seleniumbase are imported where a browser is actually used, so
+# scrapers that never open one (LOVB with backend='http') don't need them installed
+
+
+def start_driver():
+    """
+    Start a headless Chrome driver
+
+    Returns:
+        seleniumbase.Driver: The new driver
+    """
+    from seleniumbase import Driver
+
+    return Driver(browser="chrome", headless=True)
+
+
+def wait_until_ready(driver, selector, timeout=20, poll=0.1):
+    """
+    Block until an element matching a CSS selector is on the page
+
+    Args:
+        driver (seleniumbase.Driver): Driver that has just opened the page
+        selector (str): CSS selector of an element that is only there once the content rendered
+        timeout (float): Seconds to wait before giving up
+        poll (float): Seconds between checks
+
+    Returns:
+        tuple[bool, float]: Whether the element appeared, and the seconds waited
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(
+            expected_conditions.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        ready = True
+    except TimeoutException:
+        ready = False
+    return ready, time.perf_counter() - start
+
+
+class BrowserPool:
+    """
+    Pool of reusable headless browsers.
+
+    Starting Chrome is the slowest fixed cost of a Selenium scrape, so drivers
+    are started lazily, up to `size` of them, and kept warm between uses.
+    Callers borrow one with
+
+        with pool.driver() as driver:
+            driver.get(url)
+
+    and it goes back to the pool afterwards. A driver that raised while borrowed
+    is quit instead of returned, since its session may be broken; the next
+    borrower starts a fresh one. close() quits every idle driver, and the shared
+    pool from get_browser_pool() is closed when the process exits.
+    """
+
+    def __init__(self, size=6, factory=start_driver, timeout=300):
+        """
+        Args:
+            size (int): Maximum number of drivers alive at once
+            factory (callable): Starts a new driver
+            timeout (float): Seconds to wait for a free driver before giving up
+        """
+        self.size = size
+        self.factory = factory
+        self.timeout = timeout
+
+        self._idle = queue.LifoQueue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self):
+        """
+        Borrow a driver, starting one if the pool is not full yet
+
+        Returns:
+            seleniumbase.Driver: A driver that must be handed back with release()
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                start = self._started < self.size
+                if start:
+                    self._started += 1
+            if start:
+                try:
+                    return self.factory()
+                except Exception:
+                    with self._lock:
+                        self._started -= 1
+                    raise
+
+            # Pool is full: wait for a driver to come back, re-checking now and
+            # then in case a broken one was quit and freed a slot instead
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No browser became free within {self.timeout} seconds")
+            try:
+                return self._idle.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                pass
+
+    def release(self, driver, broken=False):
+        """
+        Hand a borrowed driver back, or quit it when broken or the pool is closed
+        """
+        if broken or self._closed:
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        """
+        Borrow a driver for the duration of a with block
+        """
+        driver = self.acquire()
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, broken=True)
+            raise
+        self.release(driver)
+
+    def _quit(self, driver):
+        with self._lock:
+            self._started -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+
+    def close(self):
+        """
+        Quit every idle driver. Drivers still borrowed are quit when released.
+        """
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """
+    Return the process-wide shared BrowserPool, creating it on first use
+
+    The pool size is read from the VBDB_BROWSERS environment variable (default 6, one per LOVB team).
+
+    Returns:
+        BrowserPool: The shared pool
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool(size=int(os.environ.get('VBDB_BROWSERS', '6')))
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -1,5 +1,6 @@
 import json
 import os
+import textwrap
 
 def fetch_and_combine_players():
     # Initialize fetchers
@@ -13,16 +14,26 @@ def fetch_and_combine_players():
     pvf = PVF()
     pvf_roster = pvf.fetch_players()
     ncaa_m = NCAA(gender='M')
-    ncaa_men = ncaa_m.fetch_players()
     ncaa_w = NCAA(gender='W')
-    ncaa_women = ncaa_w.fetch_players()
-    
+
+    # NCAA rosters are streamed to the file team by team as they are fetched
+    players = stream_players(lovb_roster, pvf_roster, ncaa_m.iter_players(), ncaa_w.iter_players())
+    return save_players(players)
+
+def combine_players(lovb_roster, pvf_roster, ncaa_men, ncaa_women):
     # Create a unified structure for all players
-    all_players = []
-     
+    return list(stream_players(lovb_roster, pvf_roster, ncaa_men, ncaa_women))
+
+def stream_players(lovb_roster, pvf_roster, ncaa_men, ncaa_women):
+    """
+    Yield unified player records for every source, in file order
+
+    Each roster can be a list or a generator such as NCAA.iter_players, so
+    NCAA records are only produced as they are consumed.
+    """
     # # Process LOVB players
     for player in lovb_roster:
-        all_players.append({
+        yield {
             "name": player.get('Name', ''),
             "jersey": player.get('#', ''),
             "position": player.get('Position', ''),
@@ -39,12 +50,11 @@ def fetch_and_combine_players():
             "state": None,
             "head_coach": None,
             "data_source": "LOVB"
-        })
-    print(lovb_roster)
+        }
     
     # # Process PVF players
     for player in pvf_roster:
-        all_players.append({
+        yield {
             "name": player.get('full_name', ''),
             "jersey": str(player.get('jersey_number', '')),
             "position": player.get('player_positions', ''),
@@ -61,67 +71,68 @@ def fetch_and_combine_players():
             "state": None,
             "head_coach": None,
             "data_source": "PVF"
-        })
-    print(pvf_roster)
+        }
     
     # # Process NCAA Men players
     for player in ncaa_men:
-        all_players.append({
-            "name": player.get('Name', ''),
-            "jersey": player.get('#', ''),
-            "position": player.get('Position', ''),
-            "height": player.get('Height', ''),
-            "hometown": player.get('Hometown', ''),
-            "team": player.get('team_name', ''),
-            "conference": player.get('conference_name', ''),
-            "level": "NCAA Men",
-            "division": player.get('division', ''),
-            "profile_url": f"https://stats.ncaa.org{player.get('Player URL', '')}" if player.get('Player URL') else '',
-            "college": player.get('team_name', ''),
-            "high_school": player.get('High School', ''),
-            "class_year": player.get('Class', ''),
-            "state": player.get('state', ''),
-            "head_coach": player.get('head_coach', ''),
-            "data_source": "NCAA"
-        })
-    print(ncaa_men)
+        yield ncaa_player(player, "NCAA Men")
     
     # Process NCAA Women players
     for player in ncaa_women:
-        all_players.append({
-            "name": player.get('Name', ''),
-            "jersey": player.get('#', ''),
-            "position": player.get('Position', ''),
-            "height": player.get('Height', ''),
-            "hometown": player.get('Hometown', ''),
-            "team": player.get('team_name', ''),
-            "conference": player.get('conference_name', ''),
-            "level": "NCAA Women",
-            "division": player.get('division', ''),
-            "profile_url": f"https://stats.ncaa.org{player.get('Player URL', '')}" if player.get('Player URL') else '',
-            "college": player.get('team_name', ''),
-            "high_school": player.get('High School', ''),
-            "class_year": player.get('Class', ''),
-            "state": player.get('state', ''),
-            "head_coach": player.get('head_coach', ''),
-            "data_source": "NCAA"
-        })
-    print(ncaa_women)
-    
+        yield ncaa_player(player, "NCAA Women")
+
+def ncaa_player(player, level):
+    return {
+        "name": player.get('Name', ''),
+        "jersey": player.get('#', ''),
+        "position": player.get('Position', ''),
+        "height": player.get('Height', ''),
+        "hometown": player.get('Hometown', ''),
+        "team": player.get('team_name', ''),
+        "conference": player.get('conference_name', ''),
+        "level": level,
+        "division": player.get('division', ''),
+        "profile_url": f"https://stats.ncaa.org{player.get('Player URL', '')}" if player.get('Player URL') else '',
+        "college": player.get('team_name', ''),
+        "high_school": player.get('High School', ''),
+        "class_year": player.get('Class', ''),
+        "state": player.get('state', ''),
+        "head_coach": player.get('head_coach', ''),
+        "data_source": "NCAA"
+    }
+
+def save_players(all_players):
+    """
+    Write player records to data/vbdb_players.json one at a time
+
+    The output is byte-for-byte what json.dump(all_players, indent=4,
+    ensure_ascii=False) writes, but all_players can be any iterable, so
+    records are never all held in memory. Records go to a temporary file that
+    only replaces the old one once every record is written.
+
+    Returns:
+        int: Total players written
+    """
     # Ensure data directory exists
     os.makedirs("data", exist_ok=True)
     
-    print(all_players)
-    
     # Save combined data to JSON file
     json_filename = "data/vbdb_players.json"
-    with open(json_filename, "w", encoding='utf-8') as json_file:
-        json.dump(all_players, json_file, indent=4, ensure_ascii=False)
+    total = 0
+    tmp_filename = json_filename + ".tmp"
+    with open(tmp_filename, "w", encoding='utf-8') as json_file:
+        json_file.write("[")
+        for player in all_players:
+            json_file.write(",\n" if total else "\n")
+            json_file.write(textwrap.indent(json.dumps(player, indent=4, ensure_ascii=False), "    "))
+            total += 1
+        json_file.write("\n]" if total else "]")
+    os.replace(tmp_filename, json_filename)
     
     print(f"Combined player data successfully saved to {json_filename}")
-    print(f"Total players: {len(all_players)}")
+    print(f"Total players: {total}")
     
-    return all_players
+    return total
 
 if __name__ == "__main__":
-    print(fetch_and_combine_players())
\ No newline at end of file
+    print(fetch_and_combine_players())
@@ -6,9 +6,6 @@ from fetch_pvf import PVF
 from mappings import img_map
 
 def fetch_all_teams():
-    # Ensure data directory exists
-    os.makedirs("data", exist_ok=True)
-
     # Initialize fetchers
     lovb = LOVB()
     ncaa_w = NCAA('W')
@@ -21,6 +18,11 @@ def fetch_all_teams():
     lovb_teams = lovb.fetch_teams()
     pvf_teams = pvf.fetch_teams()
 
+    all_teams = build_all_teams(lovb_teams, pvf_teams, ncaa_m_teams, ncaa_w_teams)
+    save_all_teams(all_teams)
+    return all_teams
+
+def build_all_teams(lovb_teams, pvf_teams, ncaa_m_teams, ncaa_w_teams):
     # Standardized list for all teams
     all_teams = []
 
@@ -85,6 +87,12 @@ def fetch_all_teams():
             team["img_id"] = img_dict[team_name]["id"]
             team["img"] = img_dict[team_name]["url"]
 
+    return all_teams
+
+def save_all_teams(all_teams):
+    # Ensure data directory exists
+    os.makedirs("data", exist_ok=True)
+
     json_filename = "data/vbdb_teams.json"
     with open(json_filename, "w") as json_file:
         json.dump(all_teams, json_file, indent=4)
@@ -1,10 +1,43 @@
-import requests
-from bs4 import BeautifulSoup
-from seleniumbase import Driver
+from bs4 import SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
+import time
+from browser_pool import get_browser_pool, wait_until_ready
+from html_parsing import TABLES, make_soup
+from http_client import get_client
+from rsc_payload import rsc_html
+
+# Elements that only exist once a page's content has rendered
+ROSTER_READY = 'table.roster-table'
+SCHEDULE_READY = 'div.mb-lg.grid.w-full.gap-lg'
+
+# How pages are loaded: 'http' (static HTML or its RSC payload, no browser),
+# 'browser' (headless Chrome) or 'auto' (http, falling back to the browser)
+BACKENDS = ('auto', 'http', 'browser')
+
+# VolleyStation play-by-play iframe on a match details page
+MATCH_IFRAME_CLASS = 'mt-2xl h-[23.3125rem] w-full sm:h-[24.3125rem] xl:h-[44.1875rem]'
 
 class LOVB:
 
+    def __init__(self, client=None, browsers=None, ready_timeout=20, backend=None):
+        # Shared pooled HTTP client (keep-alive connections per host)
+        self.client = client or get_client()
+        # Shared pool of warm headless browsers for the JavaScript-rendered pages
+        self.browsers = browsers or get_browser_pool()
+        # Seconds to wait for a rendered page's content before reading it anyway
+        self.ready_timeout = ready_timeout
+        # One entry per loaded page: url, selector, backend, ready, seconds
+        self.readiness = []
+
+        # match URL -> VolleyStation links, filled by fetch_match_links
+        self._match_links = {}
+
+        self.backend = backend or os.environ.get('VBDB_LOVB_BACKEND', 'auto')
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown LOVB backend: {self.backend}, expected one of {', '.join(BACKENDS)}")
+
     # Icons for the teams
     svg_icons = {
     'LOVB Salt Lake': "https://lovb.com/team-cards/salt-lake-card.svg",
@@ -36,11 +69,11 @@ class LOVB:
         url = "https://www.lovb.com/"
 
         # Fetch the page
-        response = requests.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
 
         # Parse the HTML
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(response.text)
 
         # Find all divs with the specific class
         divs = soup.find_all('div', attrs={'class': 'card relative w-full overflow-hidden'})
@@ -90,23 +123,149 @@ class LOVB:
 
         return teams
 
+    # Method to load pages without a browser, falling back to the browser pool
+    def load_pages(self, urls, ready_selector, parse_only=None):
+        """
+        Loads pages with plain HTTP when possible, rendering them in a browser otherwise.
+
+        The site is a Next.js app, so a page's content is either in the
+        server-rendered HTML already or in the RSC payload embedded in it. A page
+        counts as loaded when ready_selector matches either one. Pages that don't
+        match are rendered with render_pages, unless the backend is 'http'.
+        Each page is parsed once and the soup the readiness check ran on is returned.
+
+        Arguments
+        ---------
+        urls : list[str]
+            Pages to load.
+        ready_selector : str
+            CSS selector of the content the caller parses.
+        parse_only : SoupStrainer, optional
+            Only parse the matching parts of each page. Must keep the
+            ready_selector element.
+
+        Returns
+        -------
+        list[BeautifulSoup | Exception]: Parsed page for each of urls in order,
+        or the exception raised while loading it.
+        """
+        pages = [None] * len(urls)
+        if self.backend != 'browser' and urls:
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                pages = list(executor.map(lambda url: self._load_static_page(url, ready_selector, parse_only), urls))
+
+        missing = [index for index, page in enumerate(pages) if page is None]
+        if missing and self.backend == 'http':
+            for index in missing:
+                pages[index] = ValueError(f"No {ready_selector} in the HTML or RSC payload of {urls[index]}")
+        elif missing:
+            rendered = self.render_pages([urls[index] for index in missing], ready_selector=ready_selector)
+            for index, page in zip(missing, rendered):
+                pages[index] = page if isinstance(page, Exception) else make_soup(page, parse_only=parse_only)
+        return pages
+
+    def _load_static_page(self, url, ready_selector, parse_only=None):
+        """
+        Returns the parsed page, or markup rebuilt from its RSC payload, if
+        ready_selector matches, else None.
+        """
+        start = time.perf_counter()
+        try:
+            response = self.client.get(url)
+            response.raise_for_status()
+            soup = make_soup(response.text, parse_only=parse_only)
+            if soup.select_one(ready_selector) is None:
+                page_source = rsc_html(response.text)
+                soup = make_soup(page_source, parse_only=parse_only) if page_source else None
+                if soup is None or soup.select_one(ready_selector) is None:
+                    print(f"  No {ready_selector} in the HTML or RSC payload of {url}")
+                    return None
+        except Exception as e:
+            print(f"  Error loading {url} without a browser: {e}")
+            return None
+
+        print(f"Fetching {url}")
+        self.readiness.append({
+            'url': url, 'selector': ready_selector, 'backend': 'http',
+            'ready': True, 'seconds': time.perf_counter() - start,
+        })
+        return soup
+
+    # Method to render pages in the browser pool
+    def render_pages(self, urls, ready_selector=None):
+        """
+        Renders pages in parallel, each on a browser borrowed from the pool.
+
+        Each page is read as soon as ready_selector matches, or after
+        ready_timeout seconds if it never does. How long every page took to get
+        ready is recorded in self.readiness.
+
+        Arguments
+        ---------
+        urls : list[str]
+            Pages to open.
+        ready_selector : str, optional
+            CSS selector that marks a page as rendered. Read right away when not given.
+
+        Returns
+        -------
+        list[str | Exception]: The rendered HTML of each page in urls order, or
+        the exception raised while rendering it.
+        """
+        def render(url):
+            try:
+                with self.browsers.driver() as driver:
+                    driver.get(url)  # Open the URL
+                    print(f"Fetching {url}")
+                    if ready_selector:
+                        ready, seconds = wait_until_ready(driver, ready_selector, self.ready_timeout)
+                        self.readiness.append({
+                            'url': url, 'selector': ready_selector, 'backend': 'browser',
+                            'ready': ready, 'seconds': seconds,
+                        })
+                        if ready:
+                            print(f"  {url} ready in {seconds:.2f}s")
+                        else:
+                            print(f"  Warning: {ready_selector} not found at {url} after {seconds:.2f}s")
+                    return driver.page_source
+            except Exception as e:
+                return e
+
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.browsers.size, len(urls))) as executor:
+            return list(executor.map(render, urls))
+
     # Method to fetch and process rosters
-    def fetch_rosters(self):
-        teams = self.fetch_teams()
+    def fetch_rosters(self, teams=None):
+        """
+        Fetches the rosters of every LOVB team.
+
+        Arguments
+        ---------
+        teams : list[dict], optional
+            Teams as returned by fetch_teams. Fetched when not given.
+
+        Returns
+        -------
+        list[dict]: A list of player entries.
+        """
+        if teams is None:
+            teams = self.fetch_teams()
         roster_urls = []
         for team in teams:
             roster_urls.append(team['roster'])
 
-        driver = Driver(browser="chrome", headless=True)
         all_data = []
         unwanted_terms = ["Founding Athlete", "NEW", '-founding-athlete']
 
-        for url in roster_urls:
+        # Load the roster pages in parallel, rendering them in browsers only when needed
+        pages = self.load_pages(roster_urls, ready_selector=ROSTER_READY, parse_only=TABLES)
+
+        for url, soup in zip(roster_urls, pages):
             try:
-                driver.get(url)  # Open the URL
-                print(f"Fetching {url}")
-                page_source = driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                if isinstance(soup, Exception):
+                    raise soup
 
                 # Find all the tables with class 'roster-table'
                 tables = soup.find_all('table', class_='roster-table')
@@ -223,24 +382,35 @@ class LOVB:
         return processed_data
 
     # Method to fetch and process schedule
-    def fetch_results(self):
-        """Scrape volleyball matches using the week containers approach"""
+    def fetch_results(self, known=None, workers=16):
+        """
+        Scrape volleyball matches using the week containers approach
+
+        Arguments
+        ---------
+        known : list[dict], optional
+            Matches from an earlier run. Their VolleyStation links are reused
+            instead of fetching their match details pages again.
+        workers : int
+            Number of match details pages fetched at the same time.
+
+        Returns
+        -------
+        list[dict]: A list of match entries.
+        """
         
         url="https://www.lovb.com/schedule"
-        driver = Driver(browser="chrome", headless=True)
-        driver.get(url)  # Open the URL
-        print(f"Fetching {url}")
-        
-        # Wait for the page to load completely
-        driver.sleep(2)  # Add a small delay to ensure content loads
-        
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+
+        # Load the page once the week containers are there
+        soup = self.load_pages([url], ready_selector=SCHEDULE_READY)[0]
+        if isinstance(soup, Exception):
+            raise soup
         
         # Find all week containers
         week_containers = soup.find_all('div', attrs={'class': 'mb-lg grid w-full gap-lg'})
         
         all_matches = []
+        cards = []
         
         for week_idx, week in enumerate(week_containers):
             
@@ -328,36 +498,116 @@ class LOVB:
                     if match_details_link and "Salt Lake" in match_details_link:
                         match_details_link = match_details_link.replace('Salt Lake', 'Salt-Lake')
 
-                    res = requests.get("https://lovb.com" + match_details_link if match_details_link else "")
-                    soup = BeautifulSoup(res.content, 'html.parser')
-                    team_stats = soup.find('iframe', attrs={'class': 'mt-2xl h-[23.3125rem] w-full sm:h-[24.3125rem] xl:h-[44.1875rem]'})['src'].split('?side')[0].replace('play-by-play', 'team-stats')
-                    scoreboard = soup.find('iframe', attrs={'class': 'mt-2xl h-[23.3125rem] w-full sm:h-[24.3125rem] xl:h-[44.1875rem]'})['src'].split('?side')[0].replace('play-by-play', 'scoreboard')
+                    if not match_details_link:
+                        print("  No match details link, skipping match")
+                        continue
 
-                    # Create match object
-                    match_data = {
+                    cards.append({
                         "date": date,
                         "team_1": team_1,
                         "team_2": team_2,
                         "score": score_string,
-                        'team_stats': team_stats,
-                        'scoreboard': scoreboard,
-                        "match_url": "https://lovb.com" + match_details_link if match_details_link else ""
-                    }
-                    
-                    all_matches.append(match_data)
-                    print(f"  Match added: {match_data['team_1']} vs {match_data['team_2']}, Score: {match_data['score']}")
+                        "match_url": "https://lovb.com" + match_details_link,
+                    })
                 
                 except Exception as e:
                     print(f"  Error processing match: {e}")
-        
-        driver.quit()
-        
+
+        # Look up every match's VolleyStation links in one concurrent batch
+        links = self.fetch_match_links([card['match_url'] for card in cards], known=known, workers=workers)
+
+        for card in cards:
+            link = links[card['match_url']]
+            if isinstance(link, Exception):
+                print(f"  Error processing match: {link}")
+                continue
+
+            # Create match object
+            match_data = {
+                "date": card['date'],
+                "team_1": card['team_1'],
+                "team_2": card['team_2'],
+                "score": card['score'],
+                'team_stats': link['team_stats'],
+                'scoreboard': link['scoreboard'],
+                "match_url": card['match_url']
+            }
+
+            all_matches.append(match_data)
+            print(f"  Match added: {match_data['team_1']} vs {match_data['team_2']}, Score: {match_data['score']}")
         
         return all_matches
 
+    # Method to look up the VolleyStation links of many matches
+    def fetch_match_links(self, match_urls, known=None, workers=16):
+        """
+        Finds the VolleyStation team stats and scoreboard links of matches.
+
+        Links are cached by match URL for the life of the instance, and matches
+        whose links are in known (earlier runs' results) are not fetched at all.
+        The remaining match detail pages are fetched concurrently.
+
+        Arguments
+        ---------
+        match_urls : list[str]
+            Match details page URLs.
+        known : list[dict], optional
+            Matches from an earlier fetch_results, e.g. the saved lovb_results.json.
+        workers : int
+            Number of match pages fetched at the same time.
+
+        Returns
+        -------
+        dict: match URL -> {'team_stats', 'scoreboard'}, or the exception raised
+        while looking it up.
+        """
+        for match in known or []:
+            if match.get('match_url') and match.get('team_stats') and match.get('scoreboard'):
+                self._match_links.setdefault(match['match_url'], {
+                    'team_stats': match['team_stats'],
+                    'scoreboard': match['scoreboard'],
+                })
+
+        missing = list(dict.fromkeys(url for url in match_urls if url not in self._match_links))
+        print(f"Looking up {len(missing)} of {len(set(match_urls))} match details pages")
+
+        def lookup(url):
+            try:
+                return self._fetch_match_link(url)
+            except Exception as e:
+                return e
+
+        links = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+                for url, link in zip(missing, executor.map(lookup, missing)):
+                    if isinstance(link, Exception):
+                        links[url] = link
+                    else:
+                        self._match_links[url] = link
+
+        return {url: self._match_links.get(url, links.get(url)) for url in match_urls}
+
+    def _fetch_match_link(self, match_url):
+        """
+        Reads the VolleyStation play-by-play iframe of one match details page.
+        """
+        res = self.client.get(match_url)
+        res.raise_for_status()
+        soup = make_soup(res.content, parse_only=SoupStrainer('iframe'))
+        iframe = soup.find('iframe', attrs={'class': MATCH_IFRAME_CLASS})
+        if iframe is None or not iframe.has_attr('src'):
+            raise ValueError(f"No VolleyStation iframe found at {match_url}")
+
+        play_by_play = iframe['src'].split('?side')[0]
+        return {
+            'team_stats': play_by_play.replace('play-by-play', 'team-stats'),
+            'scoreboard': play_by_play.replace('play-by-play', 'scoreboard'),
+        }
+
     # Method to fetch teams with logos
-    def get_matches_with_logos(self):
-        matches = self.fetch_results()
+    def get_matches_with_logos(self, known=None):
+        matches = self.fetch_results(known=known)
         
         # Fix for the Atlanta team name
         corrected_icons = self.svg_icons.copy()
@@ -1,27 +1,81 @@
+import argparse
 import json
 import os
+import re
 from fetch_lovb import LOVB
 
-def fetch_and_save_matches():
+RESULTS_PATH = os.path.join("data", "lovb_results.json")
+
+# Sets won by each team at the start of a score such as "3-1 [25-22, ...]"
+SETS_WON = re.compile(r'^\s*(\d+)-(\d+)')
+
+def load_matches(path=RESULTS_PATH):
+    """Load the matches saved by the last run, or an empty list if there are none"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def is_final(match):
+    """A match is final once either team has won three sets"""
+    sets = SETS_WON.match(match.get('score', ''))
+    return bool(sets) and max(int(sets.group(1)), int(sets.group(2))) >= 3
+
+def merge_matches(previous, current):
+    """
+    Merge freshly scraped matches into the saved ones, keyed on match_url
+
+    Matches on the current schedule come first, in schedule order, with their
+    fresh data. Saved matches missing from it (no longer listed, or their
+    details failed this run) follow in their saved order, so the same inputs
+    always produce the same file.
+    """
+    merged = {}
+    for match in current:
+        merged.setdefault(match['match_url'], match)
+    for match in previous:
+        merged.setdefault(match['match_url'], match)
+    return list(merged.values())
+
+def fetch_and_save_matches(incremental=False):
+    """
+    Scrape the LOVB schedule and save it to data/lovb_results.json
+
+    The VolleyStation links of saved matches that are final are reused, so only
+    new or unfinished matches have their details page fetched. With
+    incremental=True the result is merged into the saved matches instead of
+    replacing them.
+    """
     # Create a LOVB instance
     lovb = LOVB()
+    previous = load_matches()
     
-    # Get matches with logos
-    matches_with_logos = lovb.get_matches_with_logos()
-    
+    # Get matches with logos, reusing the VolleyStation links of finished matches
+    matches_with_logos = lovb.get_matches_with_logos(known=[match for match in previous if is_final(match)])
+    if incremental:
+        matches_with_logos = merge_matches(previous, matches_with_logos)
+
+    save_matches(matches_with_logos)
+    return matches_with_logos
+
+def save_matches(matches_with_logos):
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
     
     # Define the output filename
-    output_file = os.path.join("data", "lovb_results.json")
+    output_file = RESULTS_PATH
     
     # Save to JSON file
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(matches_with_logos, f, ensure_ascii=False, indent=4)
     
     print(f"Data saved to {output_file}")
-    return matches_with_logos
 
 if __name__ == "__main__":
-    result = fetch_and_save_matches()
+    parser = argparse.ArgumentParser(description="Fetch LOVB match results")
+    parser.add_argument('--incremental', action='store_true',
+                        help=f"Merge into {RESULTS_PATH} instead of replacing it")
+    args = parser.parse_args()
+
+    result = fetch_and_save_matches(incremental=args.incremental)
     print(f"Successfully processed {len(result)} matches")
\ No newline at end of file
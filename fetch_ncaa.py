@@ -1,158 +1,567 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import multiprocessing
+import os
+from io import StringIO
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 import pandas as pd
 import numpy as np
 import re
+import threading
+import time
+from datetime import date
+from http_cache import FOREVER
+from html_parsing import PLAY_BY_PLAY, TABLES, make_soup
+from http_client import AsyncHttpClient, get_client
+
+def current_season(today=None):
+    """
+    Return the NCAA season label ('2024-25') that is in progress on a date
+
+    Seasons roll over on July 1st.
+    """
+    today = today or date.today()
+    start = today.year if today.month >= 7 else today.year - 1
+    return f"{start}-{str(start + 1)[2:]}"
+
+
+def season_ttl(year):
+    """
+    Cache TTL for a season's team and contest pages: completed seasons never change
+    """
+    return FOREVER if year < current_season() else None
+
+
+def contest_ttl(season_id):
+    """
+    Cache TTL for contest pages looked up through season_id
+
+    Contest ids don't carry their season, so only a season year ('2024-25')
+    gives one. Other contests revalidate every time (a cheap conditional
+    request), since a current-season match may still be in progress.
+    """
+    if season_id is not None and SEASON_YEAR.match(str(season_id)):
+        return season_ttl(str(season_id))
+    return None
+
+
+# Game by game table rows and the ranking prefix on opponent names (like "#8")
+CONTEST_ROW = re.compile(r'^contest_\d+')
+RANK_PREFIX = re.compile(r'^#\d+\s+')
+
+# Season year label like '2024-25'
+SEASON_YEAR = re.compile(r'^\d{4}-\d{2}$')
+
+# Team history page URL, capturing the gender and team id
+HISTORY_URL = re.compile(r'stats\.ncaa\.org/teams/history/(\w)VB/(\d+)')
+
+# Generic headers for requests
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Referer': 'https://www.google.com/',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Common conference abbreviation mappings
+CONFERENCE_MAPPING = {
+    "WAC": "Western Athletic Conference",
+    "PWC": "Pacific West Conference",
+    "RMAC": "Rocky Mountain Athletic Conference",
+    "NE-10": "Northeast-10 Conference",
+    "MIAA-MI": "Michigan Intercollegiate Athletic Association",
+    "CCS": "Collegiate Conference of the South",
+    "MAC": "Mid-American Conference",
+    "SEC": "Southeastern Conference",
+    "SWAC": "Southwestern Athletic Conf.",
+    "GSC": "Gulf South Conference",
+    "AAC": "American Athletic Conference",
+    "GNWAC": "Great Northwest Athletic Conference",
+    "AmerEast": "America East Conference",
+    "SIAC": "Southern Intercol. Ath. Conf.",
+    "GNEC": "Great Northeast Athletic Conference",
+    "MAC-Mid": "Middle Atlantic Conference Commonwealth",
+    "MAC-Atlantic": "Middle Atlantic Conferences",
+    "MAC-Atlantic": "Middle Atlantic Conference",
+    "AMCC": "Allegheny Mountain Collegiate Conference",
+    "E8": "Empire 8",
+    "PAC": "Presidents' Athletic Conference",
+    "NACC": "Northern Athletics Collegiate Conference",
+    "PL": "Patriot League",
+    "NESCAC": "New England Small College Athletic Conference",
+    "HCAC": "Heartland Collegiate Athletic Conference",
+    "SAC": "South Atlantic Conference",
+    "LSC": "Lone Star Conference",
+    "SBC": "Sun Belt Conference",
+    "Big 12": "Big 12 Conference",
+    "GAC": "Great American Conference",
+    "MIAA-MA": "Mid-America Intercollegiate Athletics Association",
+    "OVC": "Ohio Valley Conference",
+    "IND": "Independent",
+    "GMAC": "Great Midwest Athletic Conference",
+    "MIAC": "Minnesota Intercollegiate Athletic Conference",
+    "PBC": "Peach Belt Conference",
+    "CCIW": "College Conference of Illinois & Wisconsin",
+    "NSIC": "Northern Sun Intercollegiate Conference",
+    "SCAC": "Southern Collegiate Athletic Conference",
+    "ASUN": "Atlantic Sun Conference",
+    "ODAC": "Old Dominion Athletic Conf.",
+    "NEWMAC": "New England Women's and Men's Athletic Conference",
+    "OAC": "Ohio Athletic Conference",
+    "LL": "Liberty League",
+    "SSC": "Sunshine State Conference",
+    "Conf-CAR": "Conference Carolinas",
+    "CUNYAC": "City University of New York Athletic Conference",
+    "MVC": "Missouri Valley Conference",
+    "MWC-MW": "Midwest Conference",
+    "SAA": "Southern Athletic Association",
+    "UMAC": "Upper Midwest Athletic Conference",
+    "SLIAC": "St. Louis Intercollegiate Athletic Conference",
+    "CACC": "Central Atlantic Collegiate Conference",
+    "PSAC": "Pennsylvania State Athletic Conference",
+    "CIAA": "Central Intercollegiate Athletic Association",
+    "MWC-Mtn": "Mountain West Conference",
+    "ACC": "Atlantic Coast Conference",
+    "UAA": "University Athletic Association",
+    "USA South": "USA South Athletic Conference",
+    "MASCAC": "Massachusetts State Collegiate Athletic Conference",
+    "Ivy": "The Ivy League",
+    "UEC": "United East Conference",
+    "Cent-Conf": "Centennial Conference",
+    "ARC": "American Rivers Conference",
+    "SUNYAC": "State University of New York Athletic Conference",
+    "Big East": "Big East Conference",
+    "CCAA": "California Collegiate Athletic Association",
+    "SCIAC": "Southern California Intercollegiate Athletic Conf.",
+    "Big West": "Big West Conference",
+    "Big Sky": "Big Sky Conference",
+    "Big Ten": "Big Ten Conference",
+    "C2C": "Coast-To-Coast Athletic Conference",
+    "CAA": "Coastal Athletic Association",
+    "MAAC": "Metro Atlantic Athletic Conference",
+    "LC": "Landmark Conference",
+    "AtlEast": "Atlantic East Conference",
+    "NEC": "Northeast Conference",
+    "MEC": "Mountain East Conference",
+    "Big South": "Big South Conference",
+    "SoCon": "Southern Conference",
+    "HL": "Horizon League",
+    "NAC": "North Atlantic Conference",
+    "MEAC": "Mid-Eastern Athletic Conf.",
+    "CNE": "Conference of New England",
+    "ECC": "East Coast Conference",
+    "GLIAC": "Great Lakes Intercollegiate Athletic Conference",
+    "A-10": "Atlantic 10 Conference",
+    "NCAC": "North Coast Athletic Conference",
+    "Summit": "The Summit League",
+    "GLVC": "Great Lakes Valley Conference",
+    "SLC": "Southland Conference",
+    "ASC": "American Southwest Conference",
+    "LEC": "Little East Conference",
+    "Sky-Conf": "Skyline Conference",
+    "C-USA": "Conference USA",
+    "NWC": "Northwest Conference",
+    "WCC": "West Coast Conference",
+    "NJAC": "New Jersey Athletic Conference",
+    "Pac-12": "Pac-12 Conference",
+    "WIAC": "Wisconsin Intercollegiate Athletic Conference",
+    "MCVL": 'Midwest Collegiate Volleyball League',
+    "MIVA": 'Midwestern Intercollegiate Volleyball Association',
+    "NEVC": 'New England Volleyball Conference', 
+    "CC": 'Conference Carolinas',
+    "MPSF": 'Mountain Pacific Sports Federation', 
+    "BWC": 'Big West Conference',
+    "EIVA": 'Eastern Intercollegiate Volleyball Association',
+    "GNAC": 'Great Northeast Athletic Conference',
+    "CVC": 'Continental Volleyball Conference',
+    "UVC": 'United Volleyball Conference',
+    "SC": 'Skyline Conference',
+}
+
+REVERSE_CONFERENCE_MAPPING = {v: k for k, v in CONFERENCE_MAPPING.items()}
+
+
+TEAM_CODES_URL = "https://stats.ncaa.org/game_upload/team_codes"
+MEMBER_LIST_URL = "https://web3.ncaa.org/directory/api/directory/memberList?type=12&sportCode={gender}VB"
+
+
+class NCAAReference:
+    """
+    NCAA reference data shared by every NCAA instance in the process.
+
+    The stats.ncaa.org team codes table and each gender's directory member list
+    are downloaded once and reused by fetch_ncaa_teams, fetch_players and
+    fetch_schedule_for_team. Concurrent first callers wait for the single download
+    instead of starting their own.
+    """
+
+    def __init__(self, client=None, ttl=24 * 3600):
+        """
+        Args:
+            client (HttpClient, optional): Client used for downloads, defaults to the shared client
+            ttl (float, optional): Seconds before data is downloaded again (None keeps it forever)
+        """
+        self.client = client or get_client()
+        self.ttl = ttl
+        self._values = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def team_codes(self, refresh=False, ttl=None):
+        """
+        Return the stats.ncaa.org team codes table without its two header rows
+
+        Args:
+            refresh (bool): Download the table again
+            ttl (float, optional): Maximum age in seconds for this call, defaults to the reference's ttl
+
+        Returns:
+            pandas.DataFrame: Columns 0 (team id) and 1 (team short name)
+        """
+        df = self._load('team_codes', self._download_team_codes, refresh, ttl)
+        return df.copy()
+
+    def member_list(self, gender, refresh=False, ttl=None):
+        """
+        Return the web3.ncaa.org directory member list for a gender's volleyball programs
+
+        Args:
+            gender (str): 'M' | 'W'
+            refresh (bool): Download the list again
+            ttl (float, optional): Maximum age in seconds for this call, defaults to the reference's ttl
+
+        Returns:
+            list[dict]: Member list JSON records, shared so don't modify them
+        """
+        return self._load(f'member_list_{gender}', lambda: self._download_member_list(gender), refresh, ttl)
+
+    def _load(self, key, loader, refresh, ttl=None):
+        """
+        Return a cached value, running loader under the key's lock when it is missing or expired
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            cached = self._values.get(key)
+            expired = (
+                cached is None
+                or (ttl is not None and time.monotonic() - cached[0] > ttl)
+            )
+            if refresh or expired:
+                cached = (time.monotonic(), loader())
+                self._values[key] = cached
+            return cached[1]
+
+    def _download_team_codes(self):
+        response = self.client.get(TEAM_CODES_URL, headers=HEADERS)
+        response.raise_for_status()
+        df = pd.read_html(StringIO(response.text))[0]
+        return df[(df[0] != 'ID') & (df[0] != 'NCAA Codes')]
+
+    def _download_member_list(self, gender):
+        response = self.client.get(MEMBER_LIST_URL.format(gender=gender))
+        response.raise_for_status()
+        return response.json()
+
+
+_default_reference = None
+_default_reference_lock = threading.Lock()
+
+
+def get_reference():
+    """
+    Return the process-wide NCAAReference, creating it on first use
+
+    Returns:
+        NCAAReference: The shared reference data
+    """
+    global _default_reference
+    with _default_reference_lock:
+        if _default_reference is None:
+            _default_reference = NCAAReference()
+        return _default_reference
+
+
+# Play grading rules for parse_volleyball_pbp, checked in order, first match wins.
+# Each rule is (value, terms) and matches a play when all its terms hold. A term is
+# POINT (the score changes after this play) or (column, op, value[, shift]) where
+# op is 'contains' (plain substring) or '==', and shift looks at a later play.
+POINT = ('score', 'point')
+
+GRADE_RULES = [
+    ('#', [POINT, ('short_play_text', 'contains', 'kill')]),
+    ('=', [POINT, ('short_play_text', 'contains', 'error')]),
+    ('/', [('skill', '==', 'attack'), ('skill', '==', 'block', -1), ('skill', '==', 'block', -2),
+           ('play', 'contains', 'Block by', -2)]),
+    ('=', [POINT, ('play', 'contains', 'Block error')]),
+    ('#', [POINT, ('short_play_text', 'contains', 'Kill')]),
+    ('#', [POINT, ('short_play_text', 'contains', 'ace')]),
+    ('=', [POINT, ('short_play_text', 'contains', 'Reception by'), ('play', 'contains', 'Reception error')]),
+    ('#', [POINT, ('skill', '==', 'block'), ('short_play_text', 'contains', 'Block by')]),
+]
+
+# Errors are credited to the skill named in the short play text or play
+SKILL_RULES = [
+    ('set', [('skill', '==', 'error'), ('short_play_text', 'contains', 'Set')]),
+    ('block', [('skill', '==', 'error'), ('short_play_text', 'contains', 'Block')]),
+    ('reception', [('skill', '==', 'error'), ('short_play_text', 'contains', 'Reception')]),
+    ('freeball', [('skill', '==', 'error'), ('play', 'contains', 'Ball handling')]),
+    ('block', [('skill', '==', 'error'), ('play', 'contains', 'Block')]),
+    ('freeball', [('skill', '==', 'error'), ('short_play_text', '==', ''), ('play', 'contains', 'Ball handling')]),
+]
+
+
+def evaluate_rules(df, rules, default=None):
+    """
+    Evaluate a rule table over a plays DataFrame in one vectorized pass
+
+    Every distinct term is computed once as a boolean mask and shared between
+    rules, then np.select picks the first matching rule for each play.
+
+    Args:
+        df (pandas.DataFrame): Plays
+        rules (list): (value, terms) pairs, see GRADE_RULES
+        default: Value (or array) for plays matching no rule
+
+    Returns:
+        numpy.ndarray: The value of each play
+    """
+    masks = {}
+
+    def term_mask(term):
+        if term not in masks:
+            if term == POINT:
+                masks[term] = (df['score'] != df['score'].shift(-1)).to_numpy(dtype=bool)
+                return masks[term]
+
+            column, op, value = term[:3]
+            shift = term[3] if len(term) > 3 else 0
+            if shift:
+                # Value of a later play; there is none past the end
+                mask = np.roll(term_mask((column, op, value)), shift)
+                mask[shift:] = False
+            elif op == 'contains':
+                mask = df[column].str.contains(value, regex=False, na=False).to_numpy(dtype=bool)
+            else:
+                mask = (df[column] == value).to_numpy(dtype=bool)
+            masks[term] = mask
+        return masks[term]
+
+    conditions = [np.logical_and.reduce([term_mask(term) for term in terms]) for _, terms in rules]
+    choices = [value for value, _ in rules]
+    if isinstance(default, pd.Series):
+        default = default.to_numpy()
+    return np.select(conditions, choices, default=default)
+
+
+# Play forms recognised by tokenize_play, checked serve first
+SERVE_PATTERN = re.compile(r'([\w\s]+)\s+serves')
+SKILL_PATTERN = re.compile(r'([\w]+)\s+by\s+([\w\s]+)')
+SCORE_PATTERN = re.compile(r'\d+-\d+')
+
+# Columns of the plays parse_volleyball_pbp builds, in DataFrame order
+PLAY_COLUMNS = ['match_id', 'set_number', 'skill', 'player', 'play', 'school', 'score']
+
+
+def tokenize_play(play_text):
+    """
+    Classify one play's text
+
+    A play is either '<player> serves' or '<skill> by <player>'. Serves win when
+    both forms match. The cheap substring checks skip regexes that can't match.
+
+    Args:
+        play_text (str): Raw play text
+
+    Returns:
+        tuple: (normalized play text, skill, player), or None for other plays
+    """
+    play_text = ' '.join(play_text.split())
+
+    if ' serves' in play_text:
+        serve_match = SERVE_PATTERN.search(play_text)
+        if serve_match:
+            return play_text, 'serves', serve_match.group(1).strip()
+
+    if ' by ' in play_text:
+        skill_match = SKILL_PATTERN.search(play_text)
+        if skill_match:
+            skill, player = skill_match.groups()
+            return play_text, skill.lower().strip(), player.strip()
+    return None
+
+
+def parse_volleyball_pbp(html, match_id):
+    soup = make_soup(html, parse_only=PLAY_BY_PLAY)
+
+    short_play_text = []
+    short_plays = soup.find_all('span', attrs={'class': 'short_play_text'})
+    for short_play in short_plays:
+        short_play_text.append(short_play.text.strip().replace('\x01 ', '').strip())
+
+    # Find all set containers
+    set_containers = soup.find_all('div', {'class': 'col', 'style': 'max-width: 800px;'})
+    teams = {}
+    headers = soup.find_all('th')
+    for header in headers:
+        team_div = header.find('span', class_='d-none')
+        if team_div and '40%' in header.get('width', ''):
+            if 'text-align: left' in str(header) or not teams:
+                teams['left'] = team_div.text.strip()
+            else:
+                teams['right'] = team_div.text.strip()
+
+    # Plays are collected as columns, in document order
+    columns = {name: [] for name in PLAY_COLUMNS}
+    short_play_column = []
+    short_play_index = 0
+    current_score = '0-0'
+    previous_score = None
+
+    for container in set_containers:
+        # Get set number from header
+        header = container.find('div', class_='card-header')
+        if not header:
+            continue
+
+        set_text = header.text.strip()
+        current_set = int(set_text[0]) if set_text[0].isdigit() else 1
+
+        rows = container.find_all('tr')
+        for row in rows:
+            score_cell = row.find('td', string=SCORE_PATTERN)
+            if score_cell:
+                current_score = score_cell.text.strip()
+                continue
+
+            if 'scoring_plays' in row.get('class', []):
+                play_cell = row.find('td', class_='smtext')
+                if not play_cell:
+                    continue
+
+                play_text = play_cell.text.strip()
+                if not play_text:
+                    continue
+
+                token = tokenize_play(play_text)
+                if token is None:
+                    continue
+                play_text, skill, player = token
+
+                school = None
+                if play_cell.parent.find_all('td')[0].text.strip():
+                    school = teams['left']
+                else:
+                    school = teams['right']
+
+                columns['match_id'].append(match_id)
+                columns['set_number'].append(current_set)
+                columns['skill'].append(skill)
+                columns['player'].append(player)
+                columns['play'].append(play_text)
+                columns['school'].append(school)
+                columns['score'].append(current_score)
+
+                # If the score changes, move to the next short_play_text
+                short_play = None
+                if current_score != previous_score:
+                    if short_play_index < len(short_play_text):
+                        short_play = short_play_text[short_play_index]
+                        short_play_index += 1
+                    else:
+                        short_play = ""
+                short_play_column.append(short_play)
+                previous_score = current_score
+
+    columns['short_play_text'] = short_play_column
+    df = pd.DataFrame(columns)
+    df['short_play_text'] = df['short_play_text'].ffill()
+
+    df['grade'] = evaluate_rules(df, GRADE_RULES, default=None)
+    df['skill'] = evaluate_rules(df, SKILL_RULES, default=df['skill'])
+
+    df = df[df['skill'] != 'substitution']
+    df = df[df['skill'] != 'challengeoutcome']
+
+    return df
+
 
 class NCAA:
     """
     A class to interact with NCAA statistics and data.
     """
     
-    def __init__(self, gender):
+    def __init__(self, gender, client=None, teams_ttl=None, async_client=None, reference=None):
+        # Shared pooled HTTP client (keep-alive connections per host)
+        self.client = client or get_client()
+
+        # Team codes and member lists, shared process-wide unless a custom client is given
+        self.reference = reference or (NCAAReference(client) if client else get_reference())
+
+        # aiohttp-based client for the *_async methods, created on first use and
+        # closed by aclose() (or `async with NCAA(...)`) when created here
+        self.async_client = async_client
+        self._owns_async_client = False
+
+        # Maximum age in seconds of the team codes and member lists read from the
+        # reference, None leaves it to the reference's own ttl
+        self.teams_ttl = teams_ttl
+
+        # Parsed team history pages by team_id, each fetched once per instance.
+        # Concurrent callers for the same team wait on its lock for the single
+        # download (asyncio locks for the *_async methods, per event loop).
+        self._history = {}
+        self._history_locks = {}
+        self._history_lock = threading.Lock()
+        self._history_async_locks = {}
+        self._history_async_loop = None
+
         # Generic headers for requests
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Referer': 'https://www.google.com/',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        self.headers = dict(HEADERS)
         
         self.gender = gender
         
-        # Common conference abbreviation mappings
-        self.conference_mapping = {
-            "WAC": "Western Athletic Conference",
-            "PWC": "Pacific West Conference",
-            "RMAC": "Rocky Mountain Athletic Conference",
-            "NE-10": "Northeast-10 Conference",
-            "MIAA-MI": "Michigan Intercollegiate Athletic Association",
-            "CCS": "Collegiate Conference of the South",
-            "MAC": "Mid-American Conference",
-            "SEC": "Southeastern Conference",
-            "SWAC": "Southwestern Athletic Conf.",
-            "GSC": "Gulf South Conference",
-            "AAC": "American Athletic Conference",
-            "GNWAC": "Great Northwest Athletic Conference",
-            "AmerEast": "America East Conference",
-            "SIAC": "Southern Intercol. Ath. Conf.",
-            "GNEC": "Great Northeast Athletic Conference",
-            "MAC-Mid": "Middle Atlantic Conference Commonwealth",
-            "MAC-Atlantic": "Middle Atlantic Conferences",
-            "MAC-Atlantic": "Middle Atlantic Conference",
-            "AMCC": "Allegheny Mountain Collegiate Conference",
-            "E8": "Empire 8",
-            "PAC": "Presidents' Athletic Conference",
-            "NACC": "Northern Athletics Collegiate Conference",
-            "PL": "Patriot League",
-            "NESCAC": "New England Small College Athletic Conference",
-            "HCAC": "Heartland Collegiate Athletic Conference",
-            "SAC": "South Atlantic Conference",
-            "LSC": "Lone Star Conference",
-            "SBC": "Sun Belt Conference",
-            "Big 12": "Big 12 Conference",
-            "GAC": "Great American Conference",
-            "MIAA-MA": "Mid-America Intercollegiate Athletics Association",
-            "OVC": "Ohio Valley Conference",
-            "IND": "Independent",
-            "GMAC": "Great Midwest Athletic Conference",
-            "MIAC": "Minnesota Intercollegiate Athletic Conference",
-            "PBC": "Peach Belt Conference",
-            "CCIW": "College Conference of Illinois & Wisconsin",
-            "NSIC": "Northern Sun Intercollegiate Conference",
-            "SCAC": "Southern Collegiate Athletic Conference",
-            "ASUN": "Atlantic Sun Conference",
-            "ODAC": "Old Dominion Athletic Conf.",
-            "NEWMAC": "New England Women's and Men's Athletic Conference",
-            "OAC": "Ohio Athletic Conference",
-            "LL": "Liberty League",
-            "SSC": "Sunshine State Conference",
-            "Conf-CAR": "Conference Carolinas",
-            "CUNYAC": "City University of New York Athletic Conference",
-            "MVC": "Missouri Valley Conference",
-            "MWC-MW": "Midwest Conference",
-            "SAA": "Southern Athletic Association",
-            "UMAC": "Upper Midwest Athletic Conference",
-            "SLIAC": "St. Louis Intercollegiate Athletic Conference",
-            "CACC": "Central Atlantic Collegiate Conference",
-            "PSAC": "Pennsylvania State Athletic Conference",
-            "CIAA": "Central Intercollegiate Athletic Association",
-            "MWC-Mtn": "Mountain West Conference",
-            "ACC": "Atlantic Coast Conference",
-            "UAA": "University Athletic Association",
-            "USA South": "USA South Athletic Conference",
-            "MASCAC": "Massachusetts State Collegiate Athletic Conference",
-            "Ivy": "The Ivy League",
-            "UEC": "United East Conference",
-            "Cent-Conf": "Centennial Conference",
-            "ARC": "American Rivers Conference",
-            "SUNYAC": "State University of New York Athletic Conference",
-            "Big East": "Big East Conference",
-            "CCAA": "California Collegiate Athletic Association",
-            "SCIAC": "Southern California Intercollegiate Athletic Conf.",
-            "Big West": "Big West Conference",
-            "Big Sky": "Big Sky Conference",
-            "Big Ten": "Big Ten Conference",
-            "C2C": "Coast-To-Coast Athletic Conference",
-            "CAA": "Coastal Athletic Association",
-            "MAAC": "Metro Atlantic Athletic Conference",
-            "LC": "Landmark Conference",
-            "AtlEast": "Atlantic East Conference",
-            "NEC": "Northeast Conference",
-            "MEC": "Mountain East Conference",
-            "Big South": "Big South Conference",
-            "SoCon": "Southern Conference",
-            "HL": "Horizon League",
-            "NAC": "North Atlantic Conference",
-            "MEAC": "Mid-Eastern Athletic Conf.",
-            "CNE": "Conference of New England",
-            "ECC": "East Coast Conference",
-            "GLIAC": "Great Lakes Intercollegiate Athletic Conference",
-            "A-10": "Atlantic 10 Conference",
-            "NCAC": "North Coast Athletic Conference",
-            "Summit": "The Summit League",
-            "GLVC": "Great Lakes Valley Conference",
-            "SLC": "Southland Conference",
-            "ASC": "American Southwest Conference",
-            "LEC": "Little East Conference",
-            "Sky-Conf": "Skyline Conference",
-            "C-USA": "Conference USA",
-            "NWC": "Northwest Conference",
-            "WCC": "West Coast Conference",
-            "NJAC": "New Jersey Athletic Conference",
-            "Pac-12": "Pac-12 Conference",
-            "WIAC": "Wisconsin Intercollegiate Athletic Conference",
-            "MCVL": 'Midwest Collegiate Volleyball League',
-            "MIVA": 'Midwestern Intercollegiate Volleyball Association',
-            "NEVC": 'New England Volleyball Conference', 
-            "CC": 'Conference Carolinas',
-            "MPSF": 'Mountain Pacific Sports Federation', 
-            "BWC": 'Big West Conference',
-            "EIVA": 'Eastern Intercollegiate Volleyball Association',
-            "GNAC": 'Great Northeast Athletic Conference',
-            "CVC": 'Continental Volleyball Conference',
-            "UVC": 'United Volleyball Conference',
-            "SC": 'Skyline Conference',
-        }
-
-        self.reverse_mapping = {v: k for k, v in self.conference_mapping.items()}
+        # Common conference abbreviation mappings, built once per process
+        self.conference_mapping = CONFERENCE_MAPPING
+        self.reverse_mapping = REVERSE_CONFERENCE_MAPPING
         
-    def fetch_html_soup(self, url):
+    def fetch_html_soup(self, url, ttl=None, parse_only=None):
         """
         Normal process to produce soup from html
 
+        Raises requests.HTTPError if the page still fails after the client's retries.
+
         Args:
             url (str): Url you'd like to get beautiful soup from
+            ttl (float, optional): Cache TTL override for this page in seconds
+            parse_only (SoupStrainer, optional): Only parse the matching parts of the page
             
         Returns:
             BeautifulSoup: Parsed HTML content
         """
-        request = requests.get(url, headers=self.headers)
-        soup = BeautifulSoup(request.content, 'html.parser')
+        request = self.client.get(url, headers=self.headers, ttl=ttl)
+        request.raise_for_status()
+        soup = make_soup(request.content, parse_only=parse_only)
         return soup
+
+    def fetch_html_tables(self, url, ttl=None):
+        """
+        Fetch a page through the shared client and parse its tables
+
+        Args:
+            url (str): Url of the page containing the tables
+            ttl (float, optional): Cache TTL override for this page in seconds
+
+        Returns:
+            list[pandas.DataFrame]: Tables found on the page
+        """
+        response = self.client.get(url, headers=self.headers, ttl=ttl)
+        response.raise_for_status()
+        return pd.read_html(StringIO(response.text))
     
     def map_short_conf(self, df):
         """
@@ -171,6 +580,8 @@ class NCAA:
     def fetch_team_season(self, url, year):
         """
         Fetches the season URL for a specific team and year
+
+        Team history URLs are answered from the team history index.
         
         Args:
             url (str): Base URL for the team
@@ -179,23 +590,41 @@ class NCAA:
         Returns:
             str: URL path for the specified season
         """
-        soup = self.fetch_html_soup(url)
+        match = HISTORY_URL.search(url)
+        if match and match.group(1) == self.gender:
+            return "/teams/" + self.team_season(match.group(2), year)["season_id"]
+
+        soup = self.fetch_html_soup(url, parse_only=TABLES)
+        return self._parse_season_link(soup, year)
+
+    def _parse_season_link(self, soup, year):
+        """
+        Find the season URL path for a year on a parsed team history page
+        """
         data = soup.find('a', string=year)
+        if data is None:
+            raise ValueError(f"No {year} season found on team history page")
         return data['href']
 
-    def fetch_ncaa_teams(self):
+    def fetch_ncaa_teams(self, refresh=False):
         """
         Return dataframe of NCAA teams and metadata
+
+        Built from the team codes and directory member list in the reference data,
+        which are only downloaded again once older than teams_ttl seconds (the
+        reference's own ttl when teams_ttl is None).
+
+        Args:
+            refresh (bool): Download the reference data again
         
         Returns:
             pandas.DataFrame: NCAA teams with metadata
         """
-        # Fetch simple team codes
-        df = pd.read_html('https://stats.ncaa.org/game_upload/team_codes')[0]
-        team_codes = df[(df[0] != 'ID') & (df[0] != 'NCAA Codes')].rename(columns={0: 'orgId', 1: 'team_short'})
+        # Simple team codes
+        team_codes = self.reference.team_codes(refresh=refresh, ttl=self.teams_ttl).rename(columns={0: 'orgId', 1: 'team_short'})
         
-        # Fetch the team metadata
-        df_json = pd.read_json(f'https://web3.ncaa.org/directory/api/directory/memberList?type=12&sportCode={self.gender}VB')[['orgId', 'nameOfficial', 'divisionRoman', 'athleticWebUrl', 'conferenceName']]
+        # Team metadata
+        df_json = pd.DataFrame(self.reference.member_list(self.gender, refresh=refresh, ttl=self.teams_ttl))[['orgId', 'nameOfficial', 'divisionRoman', 'athleticWebUrl', 'conferenceName']]
         df_json['orgId'] = df_json['orgId'].astype(str)
         df_json['img'] = df_json['orgId'].apply(lambda x: f"https://web2.ncaa.org/ncaa_style/img/All_Logos/sm/{x}.gif")
         
@@ -204,123 +633,82 @@ class NCAA:
         
         return self.map_short_conf(df)
 
-    def fetch_schedule_for_team(self, team_id, year):
+    def fetch_schedule_for_team(self, team_id, year, teams=None):
         """
         Fetch schedule data for a specific team and year
         
         Args:
             team_id (str): Team identifier
             year (str): Season year format '2024-25'
+            teams (pandas.DataFrame, optional): Prebuilt team directory from fetch_ncaa_teams.
+                                                If None, the cached directory is used.
             
         Returns:
             pandas.DataFrame: Schedule data for the team
         """
         # Fetch teams to join home team info
-        teams = self.fetch_ncaa_teams()
+        if teams is None:
+            teams = self.fetch_ncaa_teams()
 
         # Start process to get schedule
-        url = "https://stats.ncaa.org" + self.fetch_team_season(url=f"https://stats.ncaa.org/teams/history/{self.gender}VB/{team_id}", year=year)
+        url = "https://stats.ncaa.org/teams/" + self.team_season(team_id, year)["season_id"]
         print(url)
-        soup = self.fetch_html_soup(url)
+        soup = self.fetch_html_soup(url, ttl=season_ttl(year))
 
         # get game by game urls
-        data = soup.find('a', string='Game By Game')
-        if data is None:
+        gbg_url = self._parse_gbg_url(soup)
+        if gbg_url is None:
             print(f"No 'Game By Game' link found for team {team_id} in season {year}")
             return pd.DataFrame()  # Return empty DataFrame
-        gbg_url = "https://stats.ncaa.org" + data['href']
         
         # Use game by game url and get the soup from that url
-        gbg_soup = self.fetch_html_soup(gbg_url)
-        
-        game_rows = gbg_soup.find_all('tr', id=re.compile(r'^contest_\d+'))
-        data = []
-        for row in game_rows:
-            match_id = row['id'].replace('contest_', '')
-            match_id = match_id.replace('_defense', '')
+        gbg_soup = self.fetch_html_soup(gbg_url, ttl=season_ttl(year))
+        return self._build_schedule(soup, gbg_soup, url, teams)
 
-            date = row.find('td').text.strip()
-            
-            # Team info (assuming this is available in the soup)
-            team_img = soup.find_all('img')[1]['src'] if len(soup.find_all('img')) > 1 else ""
-            team_id = team_img.split('//')[-1].replace(".gif", '') if team_img else ""
-            
-            # Opponent cell processing
-            opponent_cell = row.find_all('td')[1]
-            opponent_text = opponent_cell.text.strip()
-            
-            # Determine location
-            if '@' in opponent_text:
-                location = 'away'
-            elif '2024 NCAA' in opponent_text: 
-                location = 'NCAA'
-            else:
-                location = 'home'
-                    
-            # Extract opponent info safely
-            opponent_link = None  # Initialize before the loop
-            for a_tag in opponent_cell.find_all('a'):
-                # Only consider links with images that have height and width attributes
-                # This will filter out the defensive stats image which doesn't have these attributes
-                img_tag = a_tag.find('img')
-                if img_tag and img_tag.has_attr('height') and img_tag.has_attr('width'):
-                    opponent_link = a_tag
-                    break
-            
-            opponent_name = "Unknown"
-            opponent_img = ""
-            opponent_id = ""
-            opponent_season_id = ""
-            
-            if opponent_link:
-                # Extract text after the image
-                img_tag = opponent_link.find('img')
-                if img_tag:
-                    opponent_img = img_tag['src']
-                    opponent_id = opponent_img.split('//')[-1].replace('.gif', '')
-                    
-                    # Get opponent name (text after the image)
-                    opponent_name_parts = []
-                    for content in opponent_link.contents:
-                        if not isinstance(content, str) and content.name == 'img':
-                            continue
-                        opponent_name_parts.append(str(content).strip())
-                    opponent_name = ' '.join(opponent_name_parts).strip()
-                    
-                    # If opponent name is empty, try using alt attribute
-                    if not opponent_name and img_tag.get('alt'):
-                        opponent_name = img_tag['alt']
-                    
-                    # Remove ranking prefix (like "#8")
-                    opponent_name = re.sub(r'^#\d+\s+', '', opponent_name)
-                
-                opponent_season_id = opponent_link['href'].split('/')[-1]
-            else:
-                # Handle case where there's no link (like Paul Smiths)
-                # Extract just the opponent name without location info
-                opponent_name = opponent_text.split('\n')[0].strip()
-                if '@' in opponent_name:
-                    opponent_name = opponent_name.split('@')[1].strip()
-                
-                # Remove ranking prefix (like "#8")
-                opponent_name = re.sub(r'^#\d+\s+', '', opponent_name)
-            
-            # Get result
-            result_cell = row.find_all('td')[2]
-            result = result_cell.text.strip() if result_cell else ""
-            
+    def _parse_gbg_url(self, soup):
+        """
+        Find the 'Game By Game' URL on a parsed team season page, or None
+        """
+        data = soup.find('a', string='Game By Game')
+        if data is None:
+            return None
+        return "https://stats.ncaa.org" + data['href']
+
+    def _build_schedule(self, soup, gbg_soup, url, teams):
+        """
+        Build the schedule DataFrame from a parsed season page and game by game page
+
+        Args:
+            soup (BeautifulSoup): Parsed team season page
+            gbg_soup (BeautifulSoup): Parsed game by game page
+            url (str): Team season URL
+            teams (pandas.DataFrame): Team directory from fetch_ncaa_teams
+
+        Returns:
+            pandas.DataFrame: Schedule data for the team
+        """
+        # Per-page values, the same for every game
+        # Team info (assuming this is available in the soup)
+        images = soup.find_all('img', limit=2)
+        team_img = images[1]['src'] if len(images) > 1 else ""
+        team_id = team_img.split('//')[-1].replace(".gif", '') if team_img else ""
+        team_season_id = url.split('/')[-1]
+
+        data = []
+        for row in gbg_soup.find_all('tr', id=CONTEST_ROW):
+            game = self._parse_game_row(row)
             data.append({
-                'match_id': match_id,
-                'date': date,
+                'match_id': game['match_id'],
+                'date': game['date'],
                 'team_id': team_id,
-                'opponent_name': opponent_name,
-                'opponent_id': opponent_id,
-                'team_season_id': url.split('/')[-1],
+                'opponent_name': game['opponent_name'],
+                'opponent_id': game['opponent_id'],
+                'team_season_id': team_season_id,
                 'team_img': team_img,
-                'opponent_season_id': opponent_season_id,
-                'opponent_img': opponent_img,
-                'location': location,
-                'result': result
+                'opponent_season_id': game['opponent_season_id'],
+                'opponent_img': game['opponent_img'],
+                'location': game['location'],
+                'result': game['result']
             })
             
         df = pd.DataFrame(data)
@@ -331,47 +719,188 @@ class NCAA:
         df = df[df['date'] != '']
         return df
 
-    def fetch_schedule(self, divisions=None):
+    def _parse_game_row(self, row):
+        """
+        Extract one game from a game by game table row in a single pass over its cells
+        """
+        cells = row.find_all('td')
+        match_id = row['id'].replace('contest_', '').replace('_defense', '')
+        date = cells[0].text.strip()
+
+        # Opponent cell processing
+        opponent_cell = cells[1]
+        opponent_text = opponent_cell.text.strip()
+
+        # Determine location
+        if '@' in opponent_text:
+            location = 'away'
+        elif '2024 NCAA' in opponent_text:
+            location = 'NCAA'
+        else:
+            location = 'home'
+
+        # Only consider links with images that have height and width attributes
+        # This will filter out the defensive stats image which doesn't have these attributes
+        opponent_link = None
+        opponent_logo = None
+        for a_tag in opponent_cell.find_all('a'):
+            img_tag = a_tag.find('img')
+            if img_tag and img_tag.has_attr('height') and img_tag.has_attr('width'):
+                opponent_link = a_tag
+                opponent_logo = img_tag
+                break
+
+        opponent_name = "Unknown"
+        opponent_img = ""
+        opponent_id = ""
+        opponent_season_id = ""
+
+        if opponent_link:
+            opponent_img = opponent_logo['src']
+            opponent_id = opponent_img.split('//')[-1].replace('.gif', '')
+
+            # Get opponent name (text after the image)
+            opponent_name = ' '.join(
+                str(content).strip() for content in opponent_link.contents
+                if isinstance(content, str) or content.name != 'img'
+            ).strip()
+
+            # If opponent name is empty, try using alt attribute
+            if not opponent_name and opponent_logo.get('alt'):
+                opponent_name = opponent_logo['alt']
+
+            # Remove ranking prefix (like "#8")
+            opponent_name = RANK_PREFIX.sub('', opponent_name)
+            opponent_season_id = opponent_link['href'].split('/')[-1]
+        else:
+            # Handle case where there's no link (like Paul Smiths)
+            # Extract just the opponent name without location info
+            opponent_name = opponent_text.split('\n')[0].strip()
+            if '@' in opponent_name:
+                opponent_name = opponent_name.split('@')[1].strip()
+
+            # Remove ranking prefix (like "#8")
+            opponent_name = RANK_PREFIX.sub('', opponent_name)
+
+        return {
+            'match_id': match_id,
+            'date': date,
+            'opponent_name': opponent_name,
+            'opponent_id': opponent_id,
+            'opponent_season_id': opponent_season_id,
+            'opponent_img': opponent_img,
+            'location': location,
+            'result': cells[2].text.strip()
+        }
+
+    def fetch_schedules(self, team_ids, year='2024-25', teams=None, workers=16):
+        """
+        Fetch schedules for many teams concurrently
+
+        Each team runs the full fetch_schedule_for_team pipeline (history page,
+        season page, game by game page) on a thread pool. Requests to a single host
+        are still capped by the client's max_per_host.
+
+        Args:
+            team_ids (list): Team identifiers (orgId)
+            year (str): Season year format '2024-25'
+            teams (pandas.DataFrame, optional): Prebuilt team directory from fetch_ncaa_teams.
+                                                If None, the cached directory is used.
+            workers (int): Number of teams fetched at the same time
+
+        Returns:
+            tuple[pandas.DataFrame, dict]: Combined schedule data in team_ids order, and a
+                mapping of team_id to the error raised while fetching that team
+        """
+        schedules, failures = self._crawl_schedules(team_ids, year, teams, workers)
+        frames = [schedule for schedule in schedules.values() if not schedule.empty]
+        if frames:
+            return pd.concat(frames, ignore_index=True), failures
+        return pd.DataFrame(), failures
+
+    def _crawl_schedules(self, team_ids, year, teams, workers):
+        """
+        Run fetch_schedule_for_team for every team on a thread pool
+
+        Returns:
+            tuple[dict, dict]: team_id -> schedule DataFrame (in team_ids order),
+                team_id -> error message
+        """
+        if teams is None:
+            teams = self.fetch_ncaa_teams()
+        team_ids = list(dict.fromkeys(team_ids))
+
+        def fetch_one(team_id):
+            try:
+                return self.fetch_schedule_for_team(team_id=team_id, year=year, teams=teams), None
+            except Exception as e:
+                return None, e
+
+        schedules = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for team_id, (schedule, error) in zip(team_ids, executor.map(fetch_one, team_ids)):
+                if error is not None:
+                    failures[team_id] = f"{type(error).__name__}: {error}"
+                else:
+                    schedules[team_id] = schedule
+        return schedules, failures
+
+    def fetch_schedule(self, divisions=None, teams=None, year='2024-25', workers=16):
         """
         Fetch schedule data for specified NCAA divisions
+
+        Teams that fail to fetch are skipped and recorded in self.schedule_failures.
         
         Args:
             divisions (list or str, optional): List of divisions ('I', 'II', 'III') or a single division.
                                             If None, fetches all divisions.
+            teams (pandas.DataFrame, optional): Prebuilt team directory from fetch_ncaa_teams.
+                                                If None, the cached directory is used.
+            year (str): Season year format '2024-25'
+            workers (int): Number of teams fetched at the same time
         
         Returns:
             pandas.DataFrame: Combined schedule data for all requested divisions
         """
+        # Fetch teams
+        if teams is None:
+            teams = self.fetch_ncaa_teams()
+        team_divisions = self._schedule_teams(divisions, teams)
+
+        schedules, self.schedule_failures = self._crawl_schedules(
+            team_divisions.index, year=year, teams=teams, workers=workers
+        )
+        return self._combine_schedules(schedules, team_divisions)
+
+    def _schedule_teams(self, divisions, teams):
+        """
+        Return team_id -> division of the directory teams in the requested divisions, in division order
+        """
         # Handle input flexibility
         if divisions is None:
             divisions = ['I', 'II', 'III']
         elif isinstance(divisions, str):
             divisions = [divisions]
-            
-        # Fetch teams
-        teams = self.fetch_ncaa_teams()
-        
-        # Initialize list to store schedules
-        all_schedules = []
-        
-        # Process each division
-        for division in divisions:
-            print(f"Fetching Division {division} schedules...")
-            
-            # Fetch teams for the specified division
-            teams_df = teams[teams['divisionRoman'] == division]
-            
-            # Loop through all unique orgIds for this division
-            for team_id in teams_df['orgId'].unique():
-                try:
-                    team_schedule = self.fetch_schedule_for_team(team_id=team_id, year='2024-25')
-                    team_schedule['division'] = division
-                    all_schedules.append(team_schedule)
-                except Exception as e:
-                    print(f"Error fetching schedule for team ID {team_id}: {e}")
-                    continue
-        
+
+        teams_df = pd.concat([teams[teams['divisionRoman'] == division] for division in divisions])
+        team_divisions = teams_df.drop_duplicates('orgId').set_index('orgId')['divisionRoman']
+        print(f"Fetching Division {', '.join(divisions)} schedules for {len(team_divisions)} teams...")
+        return team_divisions
+
+    def _combine_schedules(self, schedules, team_divisions):
+        """
+        Concatenate the team schedules fetched by fetch_schedule, labelling each with its division
+        """
+        if self.schedule_failures:
+            print(f"Failed to fetch schedules for {len(self.schedule_failures)} teams")
+
         # Concatenate all team schedules into one DataFrame
+        all_schedules = []
+        for team_id, team_schedule in schedules.items():
+            team_schedule['division'] = team_divisions[team_id]
+            all_schedules.append(team_schedule)
+
         if all_schedules:
             return pd.concat(all_schedules, ignore_index=True)
         else:
@@ -388,33 +917,88 @@ class NCAA:
         Returns:
             list: A list of dictionaries containing team history
         """
-        url = f"https://stats.ncaa.org/teams/history/{self.gender}VB/{team_id}"
-        response = requests.get(url, headers=self.headers)
+        return [dict(row, team_id=team_id) for row in self.team_history(team_id)]
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    def team_history(self, team_id):
+        """
+        Return the parsed season rows of a team's history page, newest first
 
-        tbody = soup.find("tbody")
-        rows = tbody.find_all("tr")
+        This is the team history index: each page is fetched and parsed once per
+        instance and then shared by fetch_team_season, fetch_teams_history,
+        fetch_schedule_for_team and fetch_players. The returned rows are shared,
+        so don't modify them.
 
-        # Initialize a list to hold the data dictionaries
-        data_list = []
+        Args:
+            team_id (str): Team identifier
 
-        for row in rows:
-            # Extract each cell (td) in the row
-            cells = row.find_all("td")
+        Returns:
+            list[dict]: Season rows with season_id, head_coach, conference and record
+        """
+        key = str(team_id)
+        with self._history_lock:
+            key_lock = self._history_locks.setdefault(key, threading.Lock())
 
-            # Create a dictionary for the row data
-            row_data = {
-                "team_id": team_id,
-                "year": cells[0].text.strip(),  # Year (text)
-                "season_id": cells[0].find("a")["href"].split("/")[-1],
-                "head_coach": cells[1].text.strip(),  # Head Coach
-                "division": cells[2].text.strip(),  # Division
-                "conference": cells[3].text.strip(),  # Conference
-                "wins": cells[4].text.strip(),  # Wins
-                "losses": cells[5].text.strip(),  # Losses
-                "ties": cells[6].text.strip(),  # Ties
-                "wl": cells[7].text.strip(),  # Wins-Losses percentage
+        with key_lock:
+            rows = self._history.get(key)
+            if rows is None:
+                url = f"https://stats.ncaa.org/teams/history/{self.gender}VB/{team_id}"
+                response = self.client.get(url, headers=self.headers)
+                response.raise_for_status()
+
+                soup = make_soup(response.content, parse_only=TABLES)
+                rows = self._history[key] = self._parse_teams_history(soup, team_id)
+            return rows
+
+    def team_season(self, team_id, year):
+        """
+        Look up one season of a team in the team history index
+
+        Args:
+            team_id (str): Team identifier
+            year (str): Season year format '2024-25'
+
+        Returns:
+            dict: The season row (season_id, head_coach, conference, wins, losses, ...)
+        """
+        return self._find_season(self.team_history(team_id), year)
+
+    def _find_season(self, rows, year):
+        """
+        Return the history row of a season, raising ValueError if the team has none
+        """
+        for row in rows:
+            if row["year"] == year:
+                return row
+        raise ValueError(f"No {year} season found on team history page")
+
+    def _parse_teams_history(self, soup, team_id):
+        """
+        Parse the season rows of a team history page
+        """
+        tbody = soup.find("tbody")
+        if tbody is None:
+            return []
+        rows = tbody.find_all("tr")
+
+        # Initialize a list to hold the data dictionaries
+        data_list = []
+
+        for row in rows:
+            # Extract each cell (td) in the row
+            cells = row.find_all("td")
+
+            # Create a dictionary for the row data
+            row_data = {
+                "team_id": team_id,
+                "year": cells[0].text.strip(),  # Year (text)
+                "season_id": cells[0].find("a")["href"].split("/")[-1],
+                "head_coach": cells[1].text.strip(),  # Head Coach
+                "division": cells[2].text.strip(),  # Division
+                "conference": cells[3].text.strip(),  # Conference
+                "wins": cells[4].text.strip(),  # Wins
+                "losses": cells[5].text.strip(),  # Losses
+                "ties": cells[6].text.strip(),  # Ties
+                "wl": cells[7].text.strip(),  # Wins-Losses percentage
                 "notes": cells[8].text.strip(),  # Notes
             }
 
@@ -423,25 +1007,123 @@ class NCAA:
 
         return data_list
 
-    def fetch_players(self):
+    def fetch_players(self, workers=16):
         """
         Function to gather D1-D3 NCAA rosters.
 
+        Teams are fetched concurrently, see iter_players. Teams that fail to fetch
+        are skipped and recorded in self.players_failures.
+
         Parameters:
             gender (str): 'M' | 'W'
+            workers (int): Number of teams fetched at the same time
 
         Returns:
             list: A list of dictionaries containing player information
         """
-        # Get all team codes and clean a bit of data
-        df = pd.read_html("https://stats.ncaa.org/game_upload/team_codes")[0]
-        df = df[(df[0] != "NCAA Codes") & (df[0] != "ID")]
-        df.rename(columns={0: "team_id", 1: "team_name"}, inplace=True)
+        return list(self.iter_players(workers=workers))
 
-        json_data = requests.get(
-            f"https://web3.ncaa.org/directory/api/directory/memberList?type=12&sportCode={self.gender}VB&"
-        ).json()
-        
+    def iter_players(self, workers=16):
+        """
+        Yield NCAA player records team by team while rosters are fetched concurrently
+
+        Each team's head coach lookup, history page and roster page run as one task
+        on a thread pool, so up to `workers` teams are in flight at once. Records
+        are yielded in the same order fetch_players has always returned them, as
+        soon as each team (and every team before it) has finished, so callers can
+        write them out without holding all rosters in memory. No more than
+        2 * workers teams are queued or waiting to be yielded at any time, and
+        closing the generator early cancels the teams not started yet.
+
+        Teams that fail to fetch are skipped and recorded in self.players_failures
+        once the generator is exhausted.
+
+        Args:
+            workers (int): Number of teams fetched at the same time
+
+        Yields:
+            dict: Player information
+        """
+        teams_df = self._build_member_teams(self.reference.member_list(self.gender, ttl=self.teams_ttl))
+        team_ids = list(teams_df["team_id"].unique())
+
+        def fetch_one(team_id):
+            try:
+                return self._fetch_team_players(team_id, teams_df), None
+            except Exception as e:
+                return None, e
+
+        # At most 2 * workers teams are submitted or finished but not yet yielded,
+        # so one slow team can't make every later roster pile up behind it
+        window = 2 * workers
+        failures = {}
+        running = {}
+        finished = {}
+        submitted = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for position, team_id in enumerate(team_ids):
+                    while submitted < len(team_ids) and submitted - position < window:
+                        running[executor.submit(fetch_one, team_ids[submitted])] = submitted
+                        submitted += 1
+
+                    while position not in finished:
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            finished[running.pop(future)] = future.result()
+
+                    players, error = finished.pop(position)
+                    if error is not None:
+                        failures[team_id] = f"{type(error).__name__}: {error}"
+                        continue
+                    yield from players
+            finally:
+                # Closed early (GeneratorExit) or raised: drop teams that haven't started
+                for future in running:
+                    future.cancel()
+
+        self.players_failures = failures
+        if failures:
+            print(f"Failed to fetch rosters for {len(failures)} teams")
+
+    def _fetch_team_players(self, team_id, teams_df):
+        """
+        Fetch one team's head coach and roster and return its player records
+
+        Teams without a volleyball head coach, a team code or a roster table have no records.
+        """
+        url = f"https://web3.ncaa.org/directory/orgDetail?id={team_id}"
+        response = self.client.get(url, headers=self.headers)
+        response.raise_for_status()
+
+        # Parse HTML
+        soup = make_soup(response.content, parse_only=TABLES)
+        team_data = self._parse_head_coach(soup, team_id)
+        if not team_data:
+            return []
+
+        df = self._build_coaches(team_data, self.reference.team_codes(ttl=self.teams_ttl))
+        if df.empty:
+            return []
+
+        roster_link, conference_short = self._latest_season(self.team_history(team_id))
+        response = self.client.get(
+            "https://stats.ncaa.org" + roster_link + "/roster",
+            headers=self.headers
+        )
+        response.raise_for_status()
+
+        soup = make_soup(response.content, parse_only=TABLES)
+        roster_df = self._parse_roster(soup, team_id, conference_short)
+        if roster_df is None:
+            return []
+
+        return self._combine_players([roster_df], df, teams_df[teams_df["team_id"] == team_id])
+
+    def _build_member_teams(self, json_data):
+        """
+        Build the team metadata DataFrame from the directory memberList JSON
+        """
         teams_dict = []
         for json in json_data:
             teams_dict.append(
@@ -459,108 +1141,111 @@ class NCAA:
             )
         teams_df = pd.json_normalize(teams_dict)
         teams_df["team_id"] = teams_df["team_id"].astype(str)
-        
-        # List to store team data
+        return teams_df
+
+    def _parse_head_coach(self, soup, team_id):
+        """
+        Parse the volleyball head coach rows from a directory orgDetail page
+        """
         team_data = []
 
-        # Loop through each team_id
-        for team_id in teams_df["team_id"].unique():
-            url = f"https://web3.ncaa.org/directory/orgDetail?id={team_id}"
-            response = requests.get(url, headers=self.headers)
+        # Find the specific table
+        table = soup.find(
+            "table", attrs={"class": "table table-responsive table-condensed table-striped"}
+        )
+        if not table:
+            return team_data
 
-            # Parse HTML
-            soup = BeautifulSoup(response.content, "html.parser")
+        rows = table.find_all("tr")
+        for row in rows[1:]:  # Skip header row
+            columns = row.find_all("td")
+            if self.gender == "W":
+                gender_text = "Women's"
+            else:
+                gender_text = "Men's"
+            if columns and columns[0].text.strip() == f"{gender_text} Volleyball":
+                team_data.append(
+                    {
+                        "team_id": team_id,
+                        "head_coach": columns[1].text.strip(),
+                        "division_hist_url": columns[2].text.strip(),
+                        "conference": columns[3].text.strip(),
+                    }
+                )
+        return team_data
 
-            # Find the specific table
-            table = soup.find(
-                "table", attrs={"class": "table table-responsive table-condensed table-striped"}
-            )
-            if not table:
-                continue
+    def _build_coaches(self, team_data, teams):
+        """
+        Join the head coach rows with the stats.ncaa.org team codes table
 
-            rows = table.find_all("tr")
-            for row in rows[1:]:  # Skip header row
-                columns = row.find_all("td")
-                if self.gender == "W":
-                    gender_text = "Women's"
-                else:
-                    gender_text = "Men's"
-                if columns and columns[0].text.strip() == f"{gender_text} Volleyball":
-                    team_data.append(
-                        {
-                            "team_id": team_id,
-                            "head_coach": columns[1].text.strip(),
-                            "division_hist_url": columns[2].text.strip(),
-                            "conference": columns[3].text.strip(),
-                        }
-                    )
+        Returns an empty frame with the same columns when there are no coach rows.
+        """
+        if not team_data:
+            return pd.DataFrame(columns=["team_id", "head_coach", "division_hist_url", "conference", "team_short"])
 
         df = pd.json_normalize(team_data)
         df["head_coach"] = df["head_coach"].apply(
             lambda x: " ".join(x.split()) if isinstance(x, str) else x
         )
 
-        teams = pd.read_html("https://stats.ncaa.org/game_upload/team_codes")[0]
         teams = teams[(teams[0] != "NCAA Codes") & (teams[0] != "ID")]
         teams.rename(columns={0: "team_id", 1: "team_short"}, inplace=True)
         teams["team_id"] = teams["team_id"].astype(str)
         df["team_id"] = df["team_id"].astype(str)
-        df = pd.merge(df, teams, on="team_id")
+        return pd.merge(df, teams, on="team_id")
 
-        team_ids = list(df["team_id"].dropna().unique())
-        roster_list = []
+    def _latest_season(self, rows):
+        """
+        Return the latest season URL path and conference from team history rows
+        """
+        latest = rows[0]
+        return "/teams/" + latest["season_id"], latest["conference"]
 
-        for team_id in team_ids:
-            url = f"https://stats.ncaa.org/teams/history/{self.gender}VB/{team_id}"
-            response = requests.get(url, headers=self.headers)
+    def _parse_roster(self, soup, team_id, conference_short):
+        """
+        Parse a team roster page into a DataFrame, or None if it has no roster table
+        """
+        table = soup.find('table', {'id': lambda x: x and x.startswith('rosters_form_players')})
+        if not table:
+            return None
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            roster_link = soup.find('td').find('a')['href']
-            conference_short = soup.find_all('tr')[1].find_all('td')[3].text
-            response = requests.get(
-                "https://stats.ncaa.org" + roster_link + "/roster",
-                headers=self.headers
-            )
+        # Extract headers
+        headers = [th.text.strip() for th in table.find('thead').find_all('th')]
 
-            soup = BeautifulSoup(response.content, "html.parser")
+        # Add a header for the player URL
+        headers.append('Player URL')
+
+        # Extract rows
+        rows = []
+        for tr in table.find('tbody').find_all('tr'):
+            cells = tr.find_all('td')
+            row = []
+            player_url = None  # Placeholder for the player URL
             
-            table = soup.find('table', {'id': lambda x: x and x.startswith('rosters_form_players')})
-            if not table:
-                continue
+            for cell in cells:
+                # Check if the cell contains a link
+                link = cell.find('a')
+                if link:
+                    row.append(link.text.strip())  # Append the name
+                    player_url = link['href']    # Save the href for later
+                else:
+                    row.append(cell.text.strip())  # Append regular cell text
+            
+            # Append the player URL as a separate field
+            row.append(player_url)
+            rows.append(row)
 
-            # Extract headers
-            headers = [th.text.strip() for th in table.find('thead').find_all('th')]
-
-            # Add a header for the player URL
-            headers.append('Player URL')
-
-            # Extract rows
-            rows = []
-            for tr in table.find('tbody').find_all('tr'):
-                cells = tr.find_all('td')
-                row = []
-                player_url = None  # Placeholder for the player URL
-                
-                for cell in cells:
-                    # Check if the cell contains a link
-                    link = cell.find('a')
-                    if link:
-                        row.append(link.text.strip())  # Append the name
-                        player_url = link['href']    # Save the href for later
-                    else:
-                        row.append(cell.text.strip())  # Append regular cell text
-                
-                # Append the player URL as a separate field
-                row.append(player_url)
-                rows.append(row)
-
-            # Create DataFrame for the current team
-            roster_df = pd.DataFrame(rows, columns=headers)
-            roster_df['team_id'] = team_id
-            roster_df['conference_short'] = conference_short
-            roster_df['team_id'] = roster_df['team_id'].astype(str)
-            roster_list.append(roster_df)
+        # Create DataFrame for the current team
+        roster_df = pd.DataFrame(rows, columns=headers)
+        roster_df['team_id'] = team_id
+        roster_df['conference_short'] = conference_short
+        roster_df['team_id'] = roster_df['team_id'].astype(str)
+        return roster_df
 
+    def _combine_players(self, roster_list, df, teams_df):
+        """
+        Merge team rosters with coach and team metadata into player records
+        """
         # Concatenate all roster DataFrames
         if roster_list:
             roster_list_df = pd.concat(roster_list).reset_index(drop=True)
@@ -575,259 +1260,735 @@ class NCAA:
         else:
             return []
 
-    def fetch_match_details(self, season_id, summary=False, box_score=False, pbp=False):
+    def fetch_match_details(self, season_id=None, summary=False, box_score=False, pbp=False,
+                            match_ids=None, team_id=None, pbp_writer=None):
         """
-        Fetch detailed match information for a given season ID
+        Fetch detailed match information for explicit contests or a season
+
+        Contests are resolved with at most one schedule lookup, see _resolve_matches.
         
         Parameters:
-            season_id (str): Season ID to fetch match details for
+            season_id (str, optional): Season year format '2024-25', or a team season id
+                                       (team_season_id from a schedule, season_id from fetch_teams_history)
             summary (bool): Whether to fetch match summary
             box_score (bool): Whether to fetch box score data
             pbp (bool): Whether to fetch play-by-play data
+            match_ids (list, optional): Contest ids to fetch. No schedule is looked up.
+            team_id (str, optional): Only fetch this team's contests in a season year
+            pbp_writer (PlayByPlayWriter, optional): Stream plays to a Parquet dataset, see fetch_contests
             
         Returns:
             dict or DataFrame: Match details as requested
         """
-        def parse_play(play_text, school, score, match_id, set_number):
-            play_text = ' '.join(play_text.split())
-            
-            serve_match = re.search(r'([\w\s]+)\s+serves', play_text)
-            if serve_match:
-                player = serve_match.group(1).strip()
-                return {
-                    'match_id': match_id,
-                    'set_number': set_number,
-                    'skill': 'serves',
-                    'player': player,
-                    'play': play_text,
-                    'school': school,
-                    'score': score
-                }
-            
-            skill_match = re.search(r'([\w]+)\s+by\s+([\w\s]+)', play_text)
-            if skill_match:
-                skill, player = skill_match.groups()
-                return {
-                    'match_id': match_id,
-                    'set_number': set_number,
-                    'skill': skill.lower().strip(),
-                    'player': player.strip(),
-                    'play': play_text,
-                    'school': school,
-                    'score': score
-                }
-            return None
+        # Main function logic
+        match_id_list, divisions = self._resolve_matches(season_id, match_ids=match_ids, team_id=team_id)
+        return self.fetch_contests(match_id_list, summary=summary, box_score=box_score, pbp=pbp,
+                                   pbp_writer=pbp_writer, ttl=contest_ttl(season_id), divisions=divisions)
 
-        def parse_volleyball_pbp(html, match_id):
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            short_play_text = []
-            short_plays = soup.find_all('span', attrs={'class': 'short_play_text'})
-            for short_play in short_plays:
-                short_play_text.append(short_play.text.strip().replace('\x01 ', '').strip())
-
-            # Find all set containers
-            set_containers = soup.find_all('div', {'class': 'col', 'style': 'max-width: 800px;'})
-            teams = {}
-            headers = soup.find_all('th')
-            for header in headers:
-                team_div = header.find('span', class_='d-none')
-                if team_div and '40%' in header.get('width', ''):
-                    if 'text-align: left' in str(header) or not teams:
-                        teams['left'] = team_div.text.strip()
-                    else:
-                        teams['right'] = team_div.text.strip()
-            
-            all_plays = []
-            current_score = '0-0'
-            current_sequence_id = None
-            current_sequence = []
-            
-            for container in set_containers:
-                # Get set number from header
-                header = container.find('div', class_='card-header')
-                if not header:
-                    continue
-                    
-                set_text = header.text.strip()
-                current_set = int(set_text[0]) if set_text[0].isdigit() else 1
-                
-                rows = container.find_all('tr')
-                for row in rows:
-                    score_cell = row.find('td', string=re.compile(r'\d+-\d+'))
-                    if score_cell:
-                        current_score = score_cell.text.strip()
-                        if current_sequence:
-                            all_plays.extend(current_sequence)
-                            current_sequence = []
-                        continue
-                    
-                    if 'scoring_plays' in row.get('class', []):
-                        play_cell = row.find('td', class_='smtext')
-                        if not play_cell:
-                            continue
-                            
-                        play_text = play_cell.text.strip()
-                        if not play_text:
+    def fetch_contests(self, match_ids, summary=False, box_score=False, pbp=False, workers=16, processes=None,
+                       pbp_writer=None, ttl=None, divisions=None):
+        """
+        Fetch every requested product of many contests in one concurrent pass
+
+        Each contest's box_score, individual_stats and play_by_play pages are
+        separate tasks on one thread pool, so all products of all contests are in
+        flight together instead of one serial loop per product. Results keep
+        match_ids order.
+
+        Summary and box score pages are parsed on the download threads. The
+        CPU-heavy play-by-play parse gets the raw page bytes in a process pool,
+        so it scales across cores instead of serializing on the GIL while the
+        threads keep downloading. Parser processes are spawned, so scripts using
+        them need the usual `if __name__ == "__main__":` guard.
+
+        With a pbp_writer, each match's plays are appended to its Parquet dataset,
+        in its division's partition, as soon as they are parsed (in completion
+        order) instead of being concatenated in memory. The writer is closed once
+        every match is written.
+
+        Summary, box score and play-by-play failures are printed and skipped, so
+        one bad contest doesn't fail the batch. Contests whose summary failed are
+        recorded in self.summary_failures.
+
+        Parameters:
+            match_ids (list): Contest ids
+            summary (bool): Whether to fetch match summary
+            box_score (bool): Whether to fetch box score data
+            pbp (bool): Whether to fetch play-by-play data
+            workers (int): Number of pages fetched at the same time
+            processes (int, optional): Play-by-play parser processes, defaults to the CPU count
+                                       (none on a single core). 0 parses on the download threads.
+            pbp_writer (PlayByPlayWriter, optional): Stream plays to this dataset
+            ttl (float, optional): Cache TTL of the contest pages, see contest_ttl.
+                                   None revalidates them every time.
+            divisions (dict, optional): match_id -> division ('I', 'II', 'III') used to
+                                        partition the pbp_writer dataset
+
+        Returns:
+            dict: 'summary' list, 'box_score' and 'pbp' DataFrames, as requested.
+                  With a pbp_writer, 'pbp' is the list of finished Parquet files
+                  instead, or None if no plays were written.
+        """
+        if processes is None:
+            cpus = os.cpu_count() or 1
+            processes = cpus if cpus > 1 else 0
+        # Spinning up processes isn't worth it for a single contest
+        if not pbp or len(match_ids) < 2:
+            processes = 0
+
+        if processes:
+            # spawn: forking a process that is running download threads isn't safe
+            parse_pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            parse_pool = None
+
+        fetchers = {
+            'summary': lambda match_id: self._try_fetch_match_summary(match_id, ttl=ttl),
+            'box_score': lambda match_id: self._try_fetch_box_score(match_id, ttl=ttl),
+            'pbp': lambda match_id: self._try_fetch_play_by_play(match_id, parse_pool, ttl=ttl),
+        }
+        products = [name for name, wanted in (('summary', summary), ('box_score', box_score), ('pbp', pbp)) if wanted]
+        self.summary_failures = {}
+
+        try:
+            return self._run_contest_tasks(match_ids, products, fetchers, workers, pbp_writer, divisions)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+
+    def _run_contest_tasks(self, match_ids, products, fetchers, workers, pbp_writer=None, divisions=None):
+        """
+        Run the per-contest product fetchers on a thread pool and combine each product's results
+
+        Contests are submitted through a window of at most 2 * workers that are
+        not finished yet, so downloaded pages and parsed frames can't pile up.
+        A play-by-play task returns the future of its process pool parse
+        instead of waiting for it, and that future is resolved here, so the
+        download threads keep downloading while the parsers work.
+
+        With a pbp_writer, plays are written as soon as each match is parsed,
+        in completion order: the division partitions don't need match order, and
+        a slow match only holds its own slot of the window.
+        """
+        window = 2 * workers
+        stream = pbp_writer is not None and 'pbp' in products
+        divisions = divisions or {}
+        collected = {name: {} for name in products if not (stream and name == 'pbp')}
+        running = {}
+        outstanding = {}
+        submitted = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                while True:
+                    while submitted < len(match_ids) and len(outstanding) < window:
+                        outstanding[submitted] = len(products)
+                        for name in products:
+                            running[executor.submit(fetchers[name], match_ids[submitted])] = (name, submitted)
+                        submitted += 1
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, index = running.pop(future)
+                        value = self._contest_result(future, name, match_ids[index])
+                        if isinstance(value, Future):
+                            # Play-by-play still being parsed in a worker process
+                            running[value] = (name, index)
                             continue
-                        
-                        school = None
-                        if play_cell.parent.find_all('td')[0].text.strip():
-                            school = teams['left']
+                        if stream and name == 'pbp':
+                            # Written right away, so the frame is dropped once it's on disk
+                            pbp_writer.write(value, division=divisions.get(str(match_ids[index])))
                         else:
-                            school = teams['right']
-
-                        play_info = parse_play(play_text, school, current_score, match_id, current_set)
-                        if play_info:
-                            sequence_id = row.get('class')[1]
-                            if sequence_id != current_sequence_id:
-                                if current_sequence:
-                                    all_plays.extend(current_sequence)
-                                current_sequence = []
-                                current_sequence_id = sequence_id
-                            current_sequence.append(play_info)
+                            collected[name][index] = value
+
+                        # A contest leaves the window once all its products are in
+                        outstanding[index] -= 1
+                        if not outstanding[index]:
+                            del outstanding[index]
+            finally:
+                for future in running:
+                    future.cancel()
+
+        results = {}
+        if stream:
+            results['pbp'] = pbp_writer.close()
+        for name, values in collected.items():
+            data = [values[index] for index in range(len(match_ids)) if values.get(index) is not None]
+            if name == 'summary':
+                results[name] = data
+            elif data:
+                results[name] = pd.concat(data).reset_index(drop=True)
+            else:
+                results[name] = pd.DataFrame()
+        return results
+
+    def _contest_result(self, future, name, match_id):
+        """
+        Return a finished contest task's value, or None if its play-by-play parse failed
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            if name != 'pbp':
+                raise
+            print(f"Error fetching play by play for match {match_id}: {e}")
+            return None
+
+    def fetch_match_summary(self, match_id, ttl=None):
+        """
+        Fetch the set scores and game info of one contest
+
+        Args:
+            match_id (str): Contest id
+            ttl (float, optional): Cache TTL override for the page in seconds
+
+        Returns:
+            dict: Teams, set scores and summary, or None if the page has no score table
+        """
+        url = f"https://stats.ncaa.org/contests/{match_id}/box_score"
+        response = self.client.get(url, headers=self.headers, ttl=ttl)
+        response.raise_for_status()
+        soup = make_soup(response.content)
+        return self._parse_match_summary(soup, match_id)
+
+    def fetch_play_by_play(self, match_id, ttl=None):
+        """
+        Fetch and parse the play-by-play of one contest
+
+        Args:
+            match_id (str): Contest id
+            ttl (float, optional): Cache TTL override for the page in seconds
+
+        Returns:
+            pandas.DataFrame: One row per play
+        """
+        return parse_volleyball_pbp(self._fetch_play_by_play_html(match_id, ttl=ttl), match_id)
+
+    def _fetch_play_by_play_html(self, match_id, ttl=None):
+        """
+        Download the raw play-by-play page of one contest
+        """
+        url = f"https://stats.ncaa.org/contests/{match_id}/play_by_play"
+        response = self.client.get(url, headers=self.headers, ttl=ttl)
+        response.raise_for_status()
+        return response.content
+
+    def _try_fetch_match_summary(self, match_id, ttl=None):
+        try:
+            return self.fetch_match_summary(match_id, ttl=ttl)
+        except Exception as e:
+            print(f"Error fetching summary for match {match_id}: {e}")
+            self.summary_failures[match_id] = f"{type(e).__name__}: {e}"
+            return None
+
+    def _try_fetch_box_score(self, match_id, ttl=None):
+        try:
+            return self.fetch_box_score(match_id, ttl=ttl)
+        except Exception as e:
+            print(f"Error fetching box score for match {match_id}: {e}")
+            return None
+
+    def _try_fetch_play_by_play(self, match_id, parse_pool=None, ttl=None):
+        """
+        Return the parsed plays of a contest, or with a parse_pool the future of
+        their parse, so the download thread can move on to the next page
+        """
+        try:
+            if parse_pool is None:
+                return self.fetch_play_by_play(match_id, ttl=ttl)
+            # parse_volleyball_pbp is a module-level function, so it can be sent to a process
+            html = self._fetch_play_by_play_html(match_id, ttl=ttl)
+            return parse_pool.submit(parse_volleyball_pbp, html, match_id)
+        except Exception as e:
+            print(f"Error fetching play by play for match {match_id}: {e}")
+            return None
+
+    def _resolve_matches(self, season_id=None, match_ids=None, team_id=None):
+        """
+        Resolve the contest ids fetch_match_details should pull, and their divisions
+
+        - match_ids: used as given, no request
+        - season year ('2024-25') and team_id: that team's schedule
+        - season year alone: the full schedule of every division
+        - team season id: that team season's game by game page
+
+        Returns:
+            tuple[list, dict]: Contest ids, and match_id -> division for the
+                               contests that came from a schedule
+        """
+        if match_ids is not None:
+            return list(dict.fromkeys(str(match_id) for match_id in match_ids)), {}
+        if season_id is None:
+            raise ValueError("Pass match_ids or a season_id")
+
+        season_id = str(season_id)
+        if SEASON_YEAR.match(season_id):
+            if team_id is not None:
+                sch_df = self.fetch_schedule_for_team(team_id, season_id)
+            else:
+                sch_df = self.fetch_schedule(year=season_id)
+            return self._schedule_matches(sch_df)
+
+        return self._fetch_season_match_ids(season_id), {}
+
+    def _schedule_matches(self, sch_df):
+        """
+        Return the contest ids of a schedule and match_id -> division
+        """
+        if sch_df.empty:
+            return [], {}
+        # fetch_schedule labels rows with 'division', a team's schedule has its directory 'divisionRoman'
+        column = 'division' if 'division' in sch_df else 'divisionRoman'
+        divisions = {}
+        if column in sch_df:
+            for match_id, division in zip(sch_df["match_id"], sch_df[column]):
+                if isinstance(division, str) and division:
+                    divisions.setdefault(str(match_id), division)
+        return list(sch_df["match_id"].unique()), divisions
+
+    def _fetch_season_match_ids(self, team_season_id):
+        """
+        Return the played contest ids on a team season's game by game page
+        """
+        soup = self.fetch_html_soup(f"https://stats.ncaa.org/teams/{team_season_id}")
+        gbg_url = self._parse_gbg_url(soup)
+        if gbg_url is None:
+            print(f"No 'Game By Game' link found for team season {team_season_id}")
+            return []
+
+        return self._parse_season_match_ids(self.fetch_html_soup(gbg_url))
+
+    def _parse_season_match_ids(self, gbg_soup):
+        """
+        Return the played contest ids from a parsed game by game page
+        """
+        match_ids = []
+        for row in gbg_soup.find_all('tr', id=CONTEST_ROW):
+            game = self._parse_game_row(row)
+            # Same rows fetch_schedule keeps
+            if game['opponent_name'] != 'Defensive Totals' and game['date'] != '':
+                match_ids.append(game['match_id'])
+        return list(dict.fromkeys(match_ids))
+
+    def _parse_match_summary(self, soup, match_id):
+        """
+        Parse the set scores and game info from a parsed contest box_score page,
+        or None if the page has no score table
+        """
+        game_data = soup.find('table', attrs={'style': 'border-collapse: collapse'})
+        
+        if not game_data:
+            return None
+        
+        data = {
+            "match_id": match_id,
+            "teams": [],
+            "summary": {}
+        }
+        
+        header_row = game_data.find("tr")
+        sets = [cell.text.strip() for cell in header_row.find_all("td")[1:]]
+        
+        rows = game_data.find_all("tr")[1:3]
+        for row in rows:
+            cells = row.find_all("td")
+            team_name = cells[0].text.strip()
+            scores = [int(cell.text.strip()) for cell in cells[1:-1]]
+            set_wins = int(cells[-1].text.strip())
+            data["teams"].append({
+                "name": team_name,
+                "set_scores": dict(zip(sets, scores)),
+                "sets_won": set_wins,
+            })
+        
+        summary_rows = game_data.find_all("tr")[3:]
+        data["summary"] = {
+            "date": summary_rows[0].text.strip(),
+            "location": summary_rows[1].text.strip(),
+            "attendance": summary_rows[2].text.strip().replace("Attendance: ", "")
+        }
+        return data
+
+    def fetch_box_score(self, match_id, ttl=None):
+        """
+        Fetch both teams' player stats for one contest
+
+        The individual_stats page is downloaded and parsed once and both team
+        tables are taken from that parse.
+
+        Args:
+            match_id (str): Contest id
+            ttl (float, optional): Cache TTL override for the page in seconds
+
+        Returns:
+            pandas.DataFrame: One row per player with team and match_id columns
+        """
+        tables = self.fetch_html_tables(f'https://stats.ncaa.org/contests/{match_id}/individual_stats', ttl=ttl)
+        return self._build_box_score(tables, match_id)
+
+    def fetch_box_scores(self, match_ids, workers=16):
+        """
+        Fetch box scores for many contests concurrently
+
+        Contests that fail are printed and skipped.
+
+        Args:
+            match_ids (list): Contest ids
+            workers (int): Number of contests fetched at the same time
+
+        Returns:
+            pandas.DataFrame: Box scores of every contest, in match_ids order
+        """
+        return self.fetch_contests(match_ids, box_score=True, workers=workers)['box_score']
+
+    def _build_box_score(self, tables, match_id):
+        """
+        Combine the two team tables (the 4th and 5th tables) of a parsed individual_stats page
+        """
+        df = pd.concat([
+            self._parse_box_score_table(tables[3], match_id),
+            self._parse_box_score_table(tables[4], match_id),
+        ])
+        df['#'] = df['#'].astype(int)
+        return df
+
+    def _parse_box_score_table(self, df, match_id):
+        """
+        Clean one team's table from a contest individual_stats page
+        """
+        df['team'] = np.where(df['Name'] == 'TEAM', df['Name'].shift(-1), None)[-2]
+        df['match_id'] = match_id
+        return df[~df['P'].isna()]
+
+    def _get_async_client(self):
+        """
+        Return the async client, creating one on first use
+
+        The client created here shares the sync client's disk cache and rate
+        limiter, so async and sync requests to a host are paced together.
+        """
+        if self.async_client is None:
+            self.async_client = AsyncHttpClient(
+                cache=getattr(self.client, 'cache', None),
+                rate_limiter=getattr(self.client, 'rate_limiter', None),
+            )
+            self._owns_async_client = True
+        return self.async_client
+
+    async def aclose(self):
+        """
+        Close the async client if this instance created it
+        """
+        if self._owns_async_client and self.async_client is not None:
+            await self.async_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _run_parser(self, func, *args):
+        """
+        Run a blocking parse step in the default executor so it doesn't block the event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def fetch_html_soup_async(self, url, ttl=None, parse_only=None):
+        """
+        Async variant of fetch_html_soup, parsing the page in an executor
+
+        Args:
+            url (str): Url you'd like to get beautiful soup from
+            ttl (float, optional): Cache TTL override for this page in seconds
+            parse_only (SoupStrainer, optional): Only parse the matching parts of the page
             
-            if current_sequence:
-                all_plays.extend(current_sequence)
-
-            short_play_index = 0
-            previous_score = None
-            for play in all_plays:
-                current_score = play["score"]
-                
-                # If the score changes, move to the next short_play_text
-                if current_score != previous_score:
-                    if short_play_index < len(short_play_text):
-                        play["short_play_text"] = short_play_text[short_play_index]
-                        short_play_index += 1
-                    else:
-                        play["short_play_text"] = ""
+        Returns:
+            BeautifulSoup: Parsed HTML content
+        """
+        response = await self._get_async_client().get(url, headers=self.headers, ttl=ttl)
+        response.raise_for_status()
+        return await self._run_parser(make_soup, response.content, parse_only)
 
-                previous_score = current_score
+    async def fetch_html_tables_async(self, url, ttl=None):
+        """
+        Async variant of fetch_html_tables, parsing the tables in an executor
+
+        Args:
+            url (str): Url of the page containing the tables
+            ttl (float, optional): Cache TTL override for this page in seconds
 
-            df = pd.DataFrame(all_plays)
-            df['short_play_text'] = df['short_play_text'].ffill()
-
-            df['grade'] = np.where((df['score'] != df['score'].shift(-1)) & df['short_play_text'].str.contains('kill', na=False), '#', 
-                          np.where((df['score'] != df['score'].shift(-1)) & df['short_play_text'].str.contains('error', na=False), '=', 
-                          np.where((df['skill'] == 'attack') & (df['skill'].shift(-1) == 'block') & (df['skill'].shift(-2) == 'block') & (df['play'].shift(-2).str.contains('Block by', na=False)), '/', 
-                          np.where((df['score'] != df['score'].shift(-1)) & df['play'].str.contains('Block error', na=False), '=', 
-                          np.where((df['score'] != df['score'].shift(-1)) & df['short_play_text'].str.contains('Kill', na=False), '#', 
-                          np.where((df['score'] != df['score'].shift(-1)) & df['short_play_text'].str.contains('ace', na=False), '#', 
-                          np.where((df['score'] != df['score'].shift(-1)) & (df['short_play_text'].str.contains('Reception by', na=False)) & (df['play'].str.contains('Reception error', na=False)), '=', 
-                          np.where((df['score'] != df['score'].shift(-1)) & (df['skill'] == 'block') & df['short_play_text'].str.contains('Block by', na=False), '#', 
-                          None))))))))
-
-            df['skill'] = np.where((df['skill'] == 'error') & (df['short_play_text'].str.contains('Set')), 'set', 
-                                    np.where((df['skill'] == 'error') & (df['short_play_text'].str.contains('Block')), 'block', 
-                                             np.where((df['skill'] == 'error') & (df['short_play_text'].str.contains('Reception')), 'reception', 
-                                                      np.where((df['skill'] == 'error') & (df['play'].str.contains('Ball handling')), 'freeball', 
-                                                               np.where((df['skill'] == 'error') & (df['play'].str.contains('Block')), 'block', 
-                                                                        np.where((df['skill'] == 'error') & (df['short_play_text'] == '') & (df['play'].str.contains('Ball handling')), 'freeball',
-                                                               df['skill']))))))
+        Returns:
+            list[pandas.DataFrame]: Tables found on the page
+        """
+        response = await self._get_async_client().get(url, headers=self.headers, ttl=ttl)
+        response.raise_for_status()
+        return await self._run_parser(pd.read_html, StringIO(response.text))
+
+    async def fetch_schedule_for_team_async(self, team_id, year, teams=None):
+        """
+        Async variant of fetch_schedule_for_team
+        
+        Args:
+            team_id (str): Team identifier
+            year (str): Season year format '2024-25'
+            teams (pandas.DataFrame, optional): Prebuilt team directory from fetch_ncaa_teams.
+                                                If None, the cached directory is used.
             
-            df = df[df['skill'] != 'substitution']
-            df = df[df['skill'] != 'challengeoutcome']
+        Returns:
+            pandas.DataFrame: Schedule data for the team
+        """
+        if teams is None:
+            teams = await self._run_parser(self.fetch_ncaa_teams)
 
-            return df
+        history = await self.team_history_async(team_id)
+        url = "https://stats.ncaa.org/teams/" + self._find_season(history, year)["season_id"]
+        print(url)
+        soup = await self.fetch_html_soup_async(url, ttl=season_ttl(year))
 
-        def analyze_volleyball_match(html, match_id):
-            plays = parse_volleyball_pbp(html, match_id)
-            return plays
+        gbg_url = self._parse_gbg_url(soup)
+        if gbg_url is None:
+            print(f"No 'Game By Game' link found for team {team_id} in season {year}")
+            return pd.DataFrame()
 
-        # Main function logic
-        try:
-            # Using fetch_schedule might not work directly with season_id
-            # You may need to adjust how you get the match IDs
-            sch_df = pd.DataFrame(self.fetch_schedule())
-            match_id_list = list(sch_df["match_id"].unique())
-        except:
-            # Fallback to directly using the season_id
-            print(f"Using season ID directly: {season_id}")
-            match_id_list = [season_id]
+        gbg_soup = await self.fetch_html_soup_async(gbg_url, ttl=season_ttl(year))
+        return await self._run_parser(self._build_schedule, soup, gbg_soup, url, teams)
+
+    async def fetch_schedule_async(self, divisions=None, teams=None, year='2024-25'):
+        """
+        Async variant of fetch_schedule. Every team's schedule is requested
+        concurrently on the event loop.
+
+        Teams that fail to fetch are skipped and recorded in self.schedule_failures.
+
+        Args:
+            divisions (list or str, optional): List of divisions ('I', 'II', 'III') or a single division.
+                                            If None, fetches all divisions.
+            teams (pandas.DataFrame, optional): Prebuilt team directory from fetch_ncaa_teams.
+                                                If None, the cached directory is used.
+            year (str): Season year format '2024-25'
+
+        Returns:
+            pandas.DataFrame: Combined schedule data for all requested divisions
+        """
+        if teams is None:
+            teams = await self._run_parser(self.fetch_ncaa_teams)
+        team_divisions = self._schedule_teams(divisions, teams)
+
+        team_ids = list(team_divisions.index)
+        results = await asyncio.gather(
+            *(self.fetch_schedule_for_team_async(team_id, year, teams) for team_id in team_ids),
+            return_exceptions=True,
+        )
+        schedules = {}
+        self.schedule_failures = {}
+        for team_id, schedule in zip(team_ids, results):
+            if isinstance(schedule, Exception):
+                self.schedule_failures[team_id] = f"{type(schedule).__name__}: {schedule}"
+            else:
+                schedules[team_id] = schedule
+        return self._combine_schedules(schedules, team_divisions)
+
+    async def _resolve_matches_async(self, season_id=None, match_ids=None, team_id=None):
+        """
+        Async variant of _resolve_matches, crawling the schedule on the event loop
+        """
+        if match_ids is not None or season_id is None:
+            return self._resolve_matches(season_id, match_ids=match_ids, team_id=team_id)
+
+        season_id = str(season_id)
+        if SEASON_YEAR.match(season_id):
+            if team_id is not None:
+                sch_df = await self.fetch_schedule_for_team_async(team_id, season_id)
+            else:
+                sch_df = await self.fetch_schedule_async(year=season_id)
+            return self._schedule_matches(sch_df)
+
+        soup = await self.fetch_html_soup_async(f"https://stats.ncaa.org/teams/{season_id}")
+        gbg_url = self._parse_gbg_url(soup)
+        if gbg_url is None:
+            print(f"No 'Game By Game' link found for team season {season_id}")
+            return [], {}
+        gbg_soup = await self.fetch_html_soup_async(gbg_url)
+        return self._parse_season_match_ids(gbg_soup), {}
+
+    async def fetch_teams_history_async(self, team_id):
+        """
+        Async variant of fetch_teams_history
+
+        Parameters:
+            team_id (str): The ID of the team.
+
+        Returns:
+            list: A list of dictionaries containing team history
+        """
+        return [dict(row, team_id=team_id) for row in await self.team_history_async(team_id)]
+
+    async def team_history_async(self, team_id):
+        """
+        Async variant of team_history, sharing the same per-instance index
+
+        Args:
+            team_id (str): Team identifier
+
+        Returns:
+            list[dict]: Season rows with season_id, head_coach, conference and record
+        """
+        key = str(team_id)
+        loop = asyncio.get_running_loop()
+        if self._history_async_loop is not loop:
+            # asyncio locks belong to one event loop
+            self._history_async_locks = {}
+            self._history_async_loop = loop
+        key_lock = self._history_async_locks.setdefault(key, asyncio.Lock())
+
+        async with key_lock:
+            rows = self._history.get(key)
+            if rows is None:
+                soup = await self.fetch_html_soup_async(
+                    f"https://stats.ncaa.org/teams/history/{self.gender}VB/{team_id}", parse_only=TABLES
+                )
+                rows = await self._run_parser(self._parse_teams_history, soup, team_id)
+                rows = self._history.setdefault(key, rows)
+            return rows
+
+    async def fetch_players_async(self):
+        """
+        Async variant of fetch_players. Coach lookups and rosters for all teams
+        are requested concurrently on the event loop.
+
+        Teams that fail to fetch are skipped and recorded in self.players_failures,
+        like the sync path.
+
+        Returns:
+            list: A list of dictionaries containing player information
+        """
+        member_list = await self._run_parser(self.reference.member_list, self.gender, False, self.teams_ttl)
+        teams_df = self._build_member_teams(member_list)
+        failures = {}
+
+        async def fetch_coach(team_id):
+            soup = await self.fetch_html_soup_async(
+                f"https://web3.ncaa.org/directory/orgDetail?id={team_id}", parse_only=TABLES
+            )
+            return self._parse_head_coach(soup, team_id)
+
+        team_ids = list(teams_df["team_id"].unique())
+        coach_rows = await asyncio.gather(*(fetch_coach(team_id) for team_id in team_ids), return_exceptions=True)
+        team_data = []
+        for team_id, rows in zip(team_ids, coach_rows):
+            if isinstance(rows, Exception):
+                failures[team_id] = f"{type(rows).__name__}: {rows}"
+                continue
+            team_data.extend(rows)
+
+        df = self._build_coaches(team_data, await self._run_parser(self.reference.team_codes, False, self.teams_ttl))
+
+        async def fetch_roster(team_id):
+            roster_link, conference_short = self._latest_season(await self.team_history_async(team_id))
+            soup = await self.fetch_html_soup_async("https://stats.ncaa.org" + roster_link + "/roster", parse_only=TABLES)
+            return await self._run_parser(self._parse_roster, soup, team_id, conference_short)
+
+        roster_ids = list(df["team_id"].dropna().unique())
+        rosters = await asyncio.gather(*(fetch_roster(team_id) for team_id in roster_ids), return_exceptions=True)
+        roster_list = []
+        for team_id, roster_df in zip(roster_ids, rosters):
+            if isinstance(roster_df, Exception):
+                failures[team_id] = f"{type(roster_df).__name__}: {roster_df}"
+            elif roster_df is not None:
+                roster_list.append(roster_df)
+
+        self.players_failures = failures
+        if failures:
+            print(f"Failed to fetch rosters for {len(failures)} teams")
+
+        return self._combine_players(roster_list, df, teams_df)
+
+    async def fetch_box_score_async(self, match_id, ttl=None):
+        """
+        Async variant of fetch_box_score
+
+        Args:
+            match_id (str): Contest id
+            ttl (float, optional): Cache TTL override for the page in seconds
+
+        Returns:
+            pandas.DataFrame: One row per player with team and match_id columns
+        """
+        tables = await self.fetch_html_tables_async(
+            f'https://stats.ncaa.org/contests/{match_id}/individual_stats', ttl=ttl
+        )
+        return await self._run_parser(self._build_box_score, tables, match_id)
+
+    async def fetch_match_details_async(self, season_id=None, summary=False, box_score=False, pbp=False,
+                                        match_ids=None, team_id=None):
+        """
+        Async variant of fetch_match_details. Every contest page is requested
+        concurrently and parsed in an executor.
         
+        Parameters:
+            season_id (str, optional): Season year format '2024-25', or a team season id
+            summary (bool): Whether to fetch match summary
+            box_score (bool): Whether to fetch box score data
+            pbp (bool): Whether to fetch play-by-play data
+            match_ids (list, optional): Contest ids to fetch. No schedule is looked up.
+            team_id (str, optional): Only fetch this team's contests in a season year
+            
+        Returns:
+            dict: Match details as requested
+        """
+        match_id_list = (await self._resolve_matches_async(season_id, match_ids, team_id))[0]
+        ttl = contest_ttl(season_id)
+
         results = {}
-        
+
         if summary:
-            match_data = []
-            for match_id in match_id_list:
-                url = f"https://stats.ncaa.org/contests/{match_id}/box_score"
-                response = requests.get(url, headers=self.headers)
-                soup = BeautifulSoup(response.content, "html.parser")
-                game_data = soup.find('table', attrs={'style': 'border-collapse: collapse'})
-                
-                if not game_data:
-                    continue
-                
-                data = {
-                    "match_id": match_id,
-                    "teams": [],
-                    "summary": {}
-                }
-                
-                header_row = game_data.find("tr")
-                sets = [cell.text.strip() for cell in header_row.find_all("td")[1:]]
-                
-                rows = game_data.find_all("tr")[1:3]
-                for row in rows:
-                    cells = row.find_all("td")
-                    team_name = cells[0].text.strip()
-                    scores = [int(cell.text.strip()) for cell in cells[1:-1]]
-                    set_wins = int(cells[-1].text.strip())
-                    data["teams"].append({
-                        "name": team_name,
-                        "set_scores": dict(zip(sets, scores)),
-                        "sets_won": set_wins,
-                    })
-                
-                summary_rows = game_data.find_all("tr")[3:]
-                data["summary"] = {
-                    "date": summary_rows[0].text.strip(),
-                    "location": summary_rows[1].text.strip(),
-                    "attendance": summary_rows[2].text.strip().replace("Attendance: ", "")
-                }
-                match_data.append(data)
-            results['summary'] = match_data
+            self.summary_failures = {}
+
+            async def fetch_summary(match_id):
+                try:
+                    soup = await self.fetch_html_soup_async(f"https://stats.ncaa.org/contests/{match_id}/box_score", ttl=ttl)
+                    return self._parse_match_summary(soup, match_id)
+                except Exception as e:
+                    print(f"Error fetching summary for match {match_id}: {e}")
+                    self.summary_failures[match_id] = f"{type(e).__name__}: {e}"
+                    return None
+
+            match_data = await asyncio.gather(*(fetch_summary(match_id) for match_id in match_id_list))
+            results['summary'] = [data for data in match_data if data is not None]
 
         if box_score:
-            box_score_data = []
-            for match_id in match_id_list:
+            async def fetch_box_score(match_id):
                 try:
-                    df_one = pd.read_html(f'https://stats.ncaa.org/contests/{match_id}/individual_stats')[3]
-                    df_one['team'] = np.where(df_one['Name'] == 'TEAM', df_one['Name'].shift(-1), None)[-2]
-                    df_one['match_id'] = match_id
-                    df_one = df_one[~df_one['P'].isna()]
-                    
-                    df_two = pd.read_html(f'https://stats.ncaa.org/contests/{match_id}/individual_stats')[4]
-                    df_two['team'] = np.where(df_two['Name'] == 'TEAM', df_two['Name'].shift(-1), None)[-2]
-                    df_two['match_id'] = match_id
-                    df_two = df_two[~df_two['P'].isna()]
-                    
-                    df = pd.concat([df_one, df_two])
-                    df['#'] = df['#'].astype(int)
-                    box_score_data.append(df)
+                    return await self.fetch_box_score_async(match_id, ttl=ttl)
                 except Exception as e:
                     print(f"Error fetching box score for match {match_id}: {e}")
-                    continue
-                    
+                    return None
+
+            box_score_data = await asyncio.gather(*(fetch_box_score(match_id) for match_id in match_id_list))
+            box_score_data = [df for df in box_score_data if df is not None]
             if box_score_data:
                 results['box_score'] = pd.concat(box_score_data).reset_index(drop=True)
             else:
                 results['box_score'] = pd.DataFrame()
 
         if pbp:
-            pbp_data = []
-            for match_id in match_id_list:
+            async def fetch_pbp(match_id):
                 try:
-                    url = f"https://stats.ncaa.org/contests/{match_id}/play_by_play"
-                    response = requests.get(url, headers=self.headers)
-                    
-                    match_stats = analyze_volleyball_match(response.content, match_id)
-                    pbp_data.append(match_stats)
+                    response = await self._get_async_client().get(
+                        f"https://stats.ncaa.org/contests/{match_id}/play_by_play", headers=self.headers, ttl=ttl
+                    )
+                    response.raise_for_status()
+                    return await self._run_parser(parse_volleyball_pbp, response.content, match_id)
                 except Exception as e:
                     print(f"Error fetching play by play for match {match_id}: {e}")
-                    continue
-                    
+                    return None
+
+            pbp_data = await asyncio.gather(*(fetch_pbp(match_id) for match_id in match_id_list))
+            pbp_data = [df for df in pbp_data if df is not None]
             if pbp_data:
                 results['pbp'] = pd.concat(pbp_data).reset_index(drop=True)
             else:
@@ -1,7 +1,12 @@
 import requests
 from urllib.parse import urlparse, parse_qs
+from http_client import get_client
 
 class PVF:
+    def __init__(self, client=None):
+        # Shared pooled HTTP client (keep-alive connections per host)
+        self.client = client or get_client()
+
     # Function to get team details in the specified format
     def get_team_details(self, team_id, game):
         return {
@@ -37,7 +42,7 @@ class PVF:
 
         # Fetch JSON data
         url = "https://provolleyball.com/api/teams?include&sort%5B0%5D=sort&sort%5B1%5D=name"
-        response = requests.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
         teams_json = response.json().get('data', [])
 
@@ -103,7 +108,7 @@ class PVF:
             "Indy Ignite at Orlando Valkryies": "Indy Ignite at Orlando Valkyries"
         }
         # Fetch JSON data
-        response = requests.get(schedule_url)
+        response = self.client.get(schedule_url)
         response.raise_for_status()  # Raise error for HTTP issues
         games = response.json().get('data', [])
 
@@ -170,10 +175,15 @@ class PVF:
         return schedule
 
     # Method to fetch and process players
-    def fetch_players(self):
+    def fetch_players(self, teams=None):
         """
         Fetches the roster of volleyball players for all teams from the PVF API.
 
+        Arguments
+        ---------
+        teams : list[dict], optional
+            Teams as returned by fetch_teams. Fetched when not given.
+
         Example
         -------
             >>> pvf = PVF(api_url='https://provolleyball.com/api/rosters/')
@@ -186,14 +196,15 @@ class PVF:
         **list[dict]**: A list of player entries, each represented as a dictionary containing player details, 
             such as name, position, height, college, and team name.
         """
-        teams = self.fetch_teams()
+        if teams is None:
+            teams = self.fetch_teams()
         players = []
 
         for roster_ids in teams:
             roster_id = roster_ids['current_roster_id']
             try:
                 url = f"https://provolleyball.com/api/rosters/{roster_id}/player-rosters?include%5B1%5D=headshotImage&include%5B2%5D=player.headshotImage&include%5B3%5D=positions&sort%5B0%5D=players.last_name"
-                response = requests.get(url, params={"roster_id": roster_id})
+                response = self.client.get(url, params={"roster_id": roster_id})
                 response.raise_for_status()
                 rosters = response.json().get('data', [])
 
@@ -254,7 +265,7 @@ class PVF:
 
         # Fetch JSON data
         url = "https://provolleyball.com/api/volley-station/team-stats"
-        response = requests.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
         stats = response.json().get('data', [])
         
@@ -281,7 +292,7 @@ class PVF:
         # Fetch JSON data
         # Define the initial URL
         url = "https://provolleyball.com/api/volley-station/player-stats"
-        response = requests.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
 
         # Get the links
@@ -302,7 +313,7 @@ class PVF:
         all_data = []
         for page in range(first_page, last_page + 1):
             paginated_url = f"https://provolleyball.com/api/volley-station/player-stats?page={page}"
-            page_response = requests.get(paginated_url)
+            page_response = self.client.get(paginated_url)
             page_response.raise_for_status()
             
             # Parse JSON response
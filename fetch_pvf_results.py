@@ -8,7 +8,11 @@ def fetch_and_save_matches():
     
     # Get matches with logos
     matches_with_logos = pvf.fetch_schedule(when='past')
-    
+
+    save_matches(matches_with_logos)
+    return matches_with_logos
+
+def save_matches(matches_with_logos):
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
     
@@ -20,7 +24,6 @@ def fetch_and_save_matches():
         json.dump(matches_with_logos, f, ensure_ascii=False, indent=4)
     
     print(f"Data saved to {output_file}")
-    return matches_with_logos
 
 if __name__ == "__main__":
     result = fetch_and_save_matches()
@@ -1,69 +1,173 @@
+import argparse
 import pandas as pd
 import os
+from datetime import date, timedelta
 from fetch_ncaa import NCAA
 
 
-def fetch_and_combine_results():
-    """Fetch and combine NCAA volleyball schedules for both men's and women's teams."""
-    # Initialize empty list to store individual team schedules
-    df_list = []
-    
-    # Process women's teams
-    print("Fetching women's teams data...")
-    ncaa_w = NCAA(gender='W')
-    teams_w = ncaa_w.fetch_ncaa_teams()
-    
-    if not teams_w.empty:
-        total_w = len(teams_w)
-        print(f"Found {total_w} women's teams. Starting to fetch schedules...")
-        
-        for i, team_id in enumerate(teams_w['orgId']):
-            try:
-                print(f"Fetching women's schedule {i+1}/{total_w} for team ID: {team_id}")
-                team_schedule = ncaa_w.fetch_schedule_for_team(team_id, '2024-25')
-                
-                if not team_schedule.empty:
-                    team_schedule['gender'] = 'W'
-                    df_list.append(team_schedule)
-                    print(f"Successfully fetched schedule with {len(team_schedule)} games")
-                else:
-                    print(f"No schedule data found for women's team ID: {team_id}")
-            except Exception as e:
-                print(f"Error fetching women's team {team_id}: {str(e)}")
-    
-    # Process men's teams
-    print("\nFetching men's teams data...")
-    ncaa_m = NCAA(gender='M')
-    teams_m = ncaa_m.fetch_ncaa_teams()
-    
-    if not teams_m.empty:
-        total_m = len(teams_m)
-        print(f"Found {total_m} men's teams. Starting to fetch schedules...")
-        
-        for i, team_id in enumerate(teams_m['orgId']):
-            try:
-                print(f"Fetching men's schedule {i+1}/{total_m} for team ID: {team_id}")
-                team_schedule = ncaa_m.fetch_schedule_for_team(team_id, '2024-25')
-                
-                if not team_schedule.empty:
-                    team_schedule['gender'] = 'M'
-                    df_list.append(team_schedule)
-                    print(f"Successfully fetched schedule with {len(team_schedule)} games")
-                else:
-                    print(f"No schedule data found for men's team ID: {team_id}")
-            except Exception as e:
-                print(f"Error fetching men's team {team_id}: {str(e)}")
-    
+RESULTS_PATH = "data/vbdb_results.csv"
+
+# Teams that played within this many days are refetched even if every result is
+# filled in, so late score and box score corrections are picked up
+RECENT_DAYS = 3
+
+# Game number suffix on doubleheader dates, e.g. '09/05/2024(1)'
+GAME_NUMBER = r'\(\d+\)'
+
+
+def load_previous_results(path=RESULTS_PATH):
+    """
+    Load the results saved by the last run, or an empty DataFrame if there are none.
+
+    Every column is read as text exactly as written, so rows that are carried over
+    unchanged are saved back byte for byte.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def teams_to_refresh(previous, team_ids, year='2024-25', recent_days=RECENT_DAYS, today=None):
+    """
+    Pick the teams whose game by game pages may have changed since the previous run.
+
+    A team is refetched when it has no saved games for the season (new team, or its
+    fetch failed last time), when one of its games up to today has an empty result
+    (unfinished, or its result not posted yet), or when it played within the last
+    recent_days days. Games scheduled after today don't count, or nearly every team
+    would be refetched all season. A game whose date can't be read counts as pending.
+
+    Args:
+        previous (pandas.DataFrame): One gender's rows from load_previous_results
+        team_ids (list): Team identifiers (orgId) in the current team directory
+        year (str): Season year format '2024-25'
+        recent_days (int): Window for refetching teams with recent games
+        today (datetime.date, optional): Reference date, defaults to today
+
+    Returns:
+        list: Team ids to refetch, in team_ids order
+    """
+    team_ids = [str(team_id) for team_id in team_ids]
+    if previous.empty:
+        return team_ids
+
+    today = today or date.today()
+    # Doubleheaders are dated like '09/05/2024(1)'
+    dates = pd.to_datetime(
+        previous['date'].str.replace(GAME_NUMBER, '', regex=True).str.strip(), format='%m/%d/%Y', errors='coerce'
+    ).dt.date
+    undated = dates.isna()
+    season_start = date(int(year[:4]), 7, 1)
+    in_season = undated | (dates >= season_start)
+
+    blank = previous['result'].str.strip() == ''
+    pending = blank & (undated | (dates <= today))
+    recent = ~undated & (dates >= today - timedelta(days=recent_days)) & (dates <= today)
+    stale = set(previous.loc[in_season & (pending | recent), 'team_id'])
+    known = set(previous.loc[in_season, 'team_id'])
+
+    return [team_id for team_id in team_ids if team_id in stale or team_id not in known]
+
+
+def merge_results(previous, fresh, team_ids, refreshed):
+    """
+    Replace the refreshed teams' rows in the previous results
+
+    Args:
+        previous (pandas.DataFrame): One gender's rows from load_previous_results
+        fresh (pandas.DataFrame): Schedules fetched for the refreshed teams
+        team_ids (list): Team identifiers (orgId) in the current team directory
+        refreshed (set): Team ids that were refetched successfully
+
+    Returns:
+        pandas.DataFrame: Rows for every team in the directory, in team_ids order
+    """
+    previous_by_team = dict(tuple(previous.groupby('team_id', sort=False))) if not previous.empty else {}
+    fresh_by_team = dict(tuple(fresh.groupby('team_id', sort=False))) if not fresh.empty else {}
+
+    frames = []
+    for team_id in team_ids:
+        team_id = str(team_id)
+        source = fresh_by_team if team_id in refreshed else previous_by_team
+        if team_id in source:
+            frames.append(source[team_id])
+
+    if frames:
+        return pd.concat(frames, ignore_index=True)
+    return pd.DataFrame()
+
+
+def fetch_gender_results(gender, year='2024-25', workers=16, ncaa=None, teams=None, previous=None):
+    """
+    Fetch every NCAA team's schedule for one gender concurrently.
+
+    With previous results (from load_previous_results) only the teams picked by
+    teams_to_refresh are fetched, and everyone else keeps their saved rows.
+    """
+    label = "women's" if gender == 'W' else "men's"
+
+    print(f"Fetching {label} teams data...")
+    ncaa = ncaa or NCAA(gender=gender)
+    if teams is None:
+        teams = ncaa.fetch_ncaa_teams()
+
+    if teams.empty:
+        return pd.DataFrame(), {}
+
+    team_ids = list(teams['orgId'])
+    if previous is not None and not previous.empty:
+        previous = previous[previous['gender'] == gender]
+        refresh_ids = teams_to_refresh(previous, team_ids, year)
+        print(f"Found {len(teams)} {label} teams. Refreshing schedules for {len(refresh_ids)} of them...")
+    else:
+        previous = None
+        refresh_ids = team_ids
+        print(f"Found {len(teams)} {label} teams. Starting to fetch schedules...")
+
+    df, failures = ncaa.fetch_schedules(refresh_ids, year, teams=teams, workers=workers)
+    if not df.empty:
+        df['gender'] = gender
+    print(f"Fetched {len(df)} {label} games, {len(failures)} teams failed")
+
+    if previous is not None:
+        refreshed = {str(team_id) for team_id in refresh_ids} - {str(team_id) for team_id in failures}
+        df = merge_results(previous, df, team_ids, refreshed)
+    return df, failures
+
+
+def fetch_and_combine_results(year='2024-25', workers=16, incremental=False):
+    """
+    Fetch and combine NCAA volleyball schedules for both men's and women's teams.
+
+    With incremental=True the previous data/vbdb_results.csv is loaded and only
+    teams with pending or recent games are refetched.
+    """
+    previous = load_previous_results() if incremental else None
+    results_w = fetch_gender_results('W', year, workers, previous=previous)
+    results_m = fetch_gender_results('M', year, workers, previous=previous)
+    return combine_results(results_w, results_m)
+
+
+def combine_results(results_w, results_m):
+    """Combine the per-gender schedules and failures and save them."""
+    df_w, failures_w = results_w
+    df_m, failures_m = results_m
+
+    for gender, failures in (('W', failures_w), ('M', failures_m)):
+        for team_id, error in failures.items():
+            print(f"Error fetching {gender} team {team_id}: {error}")
+
     # Combine all schedules
+    df_list = [df for df in (df_w, df_m) if not df.empty]
     if df_list:
         df = pd.concat(df_list, ignore_index=True)
-        print(f"\nCombined data: {len(df)} total games across {len(df_list)} teams")
+        print(f"\nCombined data: {len(df)} total games")
         
         # Create data directory if it doesn't exist
         os.makedirs("data", exist_ok=True)
         
         # Save with the correct filename that matches the workflow check
-        output_path = "data/vbdb_results.csv"
+        output_path = RESULTS_PATH
         df.to_csv(output_path, index=False)
         print(f"Data saved to {output_path}")
         
@@ -73,5 +177,12 @@ def fetch_and_combine_results():
         return pd.DataFrame()
 
 if __name__ == "__main__":
-    result = fetch_and_combine_results()
-    print(f"Final dataframe shape: {result.shape if not result.empty else 'Empty'}")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Fetch NCAA volleyball results for both genders")
+    parser.add_argument('--year', default='2024-25', help="NCAA season, e.g. 2024-25")
+    parser.add_argument('--workers', type=int, default=16, help="Concurrent teams per gender")
+    parser.add_argument('--incremental', action='store_true',
+                        help=f"Only refetch teams with pending or recent games in {RESULTS_PATH}")
+    args = parser.parse_args()
+
+    result = fetch_and_combine_results(args.year, args.workers, incremental=args.incremental)
+    print(f"Final dataframe shape: {result.shape if not result.empty else 'Empty'}")
@@ -0,0 +1,36 @@
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# BeautifulSoup tree builder used by every scraper. lxml is much faster than the
+# pure-Python 'html.parser'; set VBDB_HTML_PARSER=html.parser to switch back.
+PARSER = os.environ.get('VBDB_HTML_PARSER', 'lxml')
+
+# Fast paths: only build the parts of a page a parser actually reads.
+# Tables only: team history, roster and directory orgDetail pages
+TABLES = SoupStrainer('table')
+# Play-by-play pages: set containers, team header cells and short play spans
+PLAY_BY_PLAY = SoupStrainer(['div', 'table', 'span'])
+
+
+def make_soup(markup, parse_only=None):
+    """
+    Parse HTML with the configured parser backend
+
+    Args:
+        markup (str | bytes): Page content
+        parse_only (SoupStrainer, optional): Only keep matching elements and their children
+
+    Returns:
+        BeautifulSoup: Parsed HTML content
+    """
+    return BeautifulSoup(markup, PARSER, parse_only=parse_only)
+
+
+def set_parser(name):
+    """
+    Change the parser backend for the rest of the process, e.g. 'lxml' | 'html.parser'
+    """
+    global PARSER
+    PARSER = name
@@ -0,0 +1,159 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from urllib.parse import urlencode
+
+
+# TTL meaning "never expires", e.g. pages of a completed season
+FOREVER = float('inf')
+
+# (url pattern, ttl in seconds) pairs, first match wins
+DEFAULT_TTL_RULES = [
+    (r'stats\.ncaa\.org/game_upload/team_codes', 24 * 3600),
+    (r'web3\.ncaa\.org/directory/', 24 * 3600),
+    (r'stats\.ncaa\.org/teams/history/', 12 * 3600),
+]
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache for GET responses.
+
+    Bodies are stored gzip-compressed and content-addressed by their sha256, so
+    identical pages fetched from different URLs are only stored once. Each URL
+    has a small JSON entry pointing at its body and remembering the ETag and
+    Last-Modified validators. Fresh entries are served without a request, stale
+    ones are revalidated with a conditional request.
+    """
+
+    def __init__(self, path, ttl_rules=None, default_ttl=0):
+        """
+        Args:
+            path (str): Cache directory
+            ttl_rules (list, optional): (url regex, ttl seconds) pairs, first match wins.
+                                        Defaults to DEFAULT_TTL_RULES.
+            default_ttl (float): TTL for urls matching no rule. 0 revalidates every time.
+        """
+        self.path = path
+        self.ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in (ttl_rules or DEFAULT_TTL_RULES)]
+        self.default_ttl = default_ttl
+
+        os.makedirs(os.path.join(path, 'entries'), exist_ok=True)
+        os.makedirs(os.path.join(path, 'bodies'), exist_ok=True)
+
+    def key(self, url, params=None):
+        """
+        Return the cache key of a url and its query parameters
+        """
+        if params:
+            url = url + ('&' if '?' in url else '?') + urlencode(sorted(params.items()))
+        return url
+
+    def ttl_for(self, url):
+        """
+        Return the TTL in seconds configured for a url
+        """
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key):
+        """
+        Return the stored entry for a key, or None
+        """
+        try:
+            with open(self._entry_path(key), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key or not os.path.exists(self._body_path(entry['digest'])):
+            return None
+        return entry
+
+    def is_fresh(self, entry, ttl=None):
+        """
+        Whether an entry can be served without revalidation
+
+        Args:
+            entry (dict): Entry from lookup
+            ttl (float, optional): TTL override in seconds, defaults to the url's rule
+        """
+        if ttl is None:
+            ttl = self.ttl_for(entry['key'])
+        return time.time() - entry['fetched_at'] <= ttl
+
+    def conditional_headers(self, entry):
+        """
+        Return If-None-Match / If-Modified-Since headers for revalidating an entry
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load(self, entry):
+        """
+        Return the (status, headers, body) stored for an entry
+        """
+        with open(self._body_path(entry['digest']), 'rb') as f:
+            body = gzip.decompress(f.read())
+        return entry['status'], entry['headers'], body
+
+    def store(self, key, status, headers, body):
+        """
+        Store a successful response body and its validators
+
+        Returns:
+            dict: The new entry
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, gzip.compress(body))
+
+        kept_headers = {name: headers[name] for name in ('Content-Type', 'ETag', 'Last-Modified') if name in headers}
+        entry = {
+            'key': key,
+            'digest': digest,
+            'status': status,
+            'headers': kept_headers,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        self._write_atomic(self._entry_path(key), json.dumps(entry).encode('utf-8'))
+        return entry
+
+    def touch(self, entry):
+        """
+        Mark an entry as revalidated now (after a 304 Not Modified)
+        """
+        entry = dict(entry, fetched_at=time.time())
+        self._write_atomic(self._entry_path(entry['key']), json.dumps(entry).encode('utf-8'))
+        return entry
+
+    def _entry_path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, 'entries', digest[:2], digest + '.json')
+
+    def _body_path(self, digest):
+        return os.path.join(self.path, 'bodies', digest[:2], digest + '.gz')
+
+    def _write_atomic(self, path, data):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
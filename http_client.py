@@ -0,0 +1,503 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from http_cache import ResponseCache
+
+try:
+    import aiohttp
+except ImportError:  # Only needed by AsyncHttpClient (pip install vbdb-data[async])
+    aiohttp = None
+
+
+# Status codes that mean "slow down / try again later"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by hostname.
+
+    Each host gets its own bucket refilled at `rate` requests per second and
+    holding at most `burst` tokens. The rate adapts to the observed error rate:
+    it is halved whenever a host answers 429/5xx and grows back towards the
+    configured rate with every successful response.
+    """
+
+    def __init__(self, rate=10.0, burst=20, min_rate=0.5, host_limits=None):
+        """
+        Args:
+            rate (float): Maximum requests per second per host
+            burst (int): Maximum number of requests sent back to back
+            min_rate (float): Floor the adaptive rate never drops below
+            host_limits (dict, optional): Per-host overrides, hostname -> (rate, burst)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.host_limits = host_limits or {}
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host, now):
+        if host not in self._buckets:
+            rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+            self._buckets[host] = {
+                'max_rate': rate,
+                'rate': rate,
+                'burst': burst,
+                'tokens': burst,
+                'updated': now,
+                'paused_until': 0.0,
+            }
+        return self._buckets[host]
+
+    def reserve(self, host):
+        """
+        Take a token for host and return how long the caller must wait before sending
+
+        Args:
+            host (str): Hostname the request goes to
+
+        Returns:
+            float: Seconds to wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            elapsed = now - bucket['updated']
+            bucket['tokens'] = min(bucket['burst'], bucket['tokens'] + elapsed * bucket['rate'])
+            bucket['updated'] = now
+            bucket['tokens'] -= 1
+            wait = -bucket['tokens'] / bucket['rate'] if bucket['tokens'] < 0 else 0.0
+            return max(wait, bucket['paused_until'] - now)
+
+    def record(self, host, throttled):
+        """
+        Adapt the host's rate to the outcome of a request
+
+        Args:
+            host (str): Hostname the request went to
+            throttled (bool): Whether the host answered 429/5xx or failed
+        """
+        with self._lock:
+            bucket = self._bucket(host, time.monotonic())
+            if throttled:
+                bucket['rate'] = max(self.min_rate, bucket['rate'] / 2)
+            else:
+                bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + bucket['max_rate'] / 20)
+
+    def pause(self, host, seconds):
+        """
+        Hold every request to host for the given number of seconds (Retry-After)
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            bucket['paused_until'] = max(bucket['paused_until'], now + seconds)
+
+    def current_rate(self, host):
+        """
+        Return the adaptive rate currently used for host
+        """
+        with self._lock:
+            return self._bucket(host, time.monotonic())['rate']
+
+
+class HttpClient:
+    """
+    Shared HTTP client used by the NCAA, PVF and LOVB fetchers.
+
+    Wraps a single requests.Session so connections are kept alive and reused
+    per host instead of opening a new TCP+TLS connection for every request.
+    Requests are paced by a per-host RateLimiter and retried with exponential
+    backoff and jitter on 429/5xx and connection errors. With a ResponseCache,
+    fresh pages are served from disk and stale ones are revalidated.
+    """
+
+    def __init__(self, pool_connections=32, pool_maxsize=32, timeout=30, max_per_host=16,
+                 rate_limiter=None, max_retries=4, backoff_base=0.5, backoff_max=60.0, cache=None):
+        """
+        Args:
+            pool_connections (int): Number of per-host connection pools to keep
+            pool_maxsize (int): Maximum number of open connections kept per host
+            timeout (float): Default request timeout in seconds
+            max_per_host (int, optional): Maximum number of requests in flight to a
+                                          single host across all threads. None disables the cap.
+            rate_limiter (RateLimiter, optional): Per-host pacing. Defaults to RateLimiter().
+            max_retries (int): Retries after a 429/5xx response or connection error
+            backoff_base (float): First backoff delay in seconds, doubled on every retry
+            backoff_max (float): Upper bound for a single backoff delay in seconds
+            cache (ResponseCache, optional): On-disk response cache. None disables caching.
+        """
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self.session = requests.Session()
+
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, headers=None, params=None, ttl=None, **kwargs):
+        """
+        Issue a GET request through the pooled session
+
+        Retryable failures are retried up to max_retries times. If the host still
+        answers 429/5xx the last response is returned, a connection error is raised.
+
+        Args:
+            url (str): Url to fetch
+            headers (dict, optional): Extra request headers
+            params (dict, optional): Query string parameters
+            ttl (float, optional): Cache TTL in seconds for this url, overriding the
+                                   cache's url rules (http_cache.FOREVER never expires)
+
+        Returns:
+            requests.Response: The response
+        """
+        if self.cache is None:
+            return self._fetch(url, headers=headers, params=params, **kwargs)
+
+        key = self.cache.key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if self.cache.is_fresh(entry, ttl):
+                return cached_response(self.cache, entry)
+            headers = {**(headers or {}), **self.cache.conditional_headers(entry)}
+
+        response = self._fetch(url, headers=headers, params=params, **kwargs)
+        return update_cache(self.cache, key, entry, response)
+
+    def _fetch(self, url, headers=None, params=None, **kwargs):
+        """
+        Send a request with rate limiting and retries
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).netloc
+
+        for attempt in range(self.max_retries + 1):
+            time.sleep(self.rate_limiter.reserve(host))
+            try:
+                response = self._send(url, headers=headers, params=params, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.rate_limiter.record(host, throttled=True)
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+                continue
+
+            if response.status_code not in RETRY_STATUSES:
+                self.rate_limiter.record(host, throttled=False)
+                return response
+
+            self.rate_limiter.record(host, throttled=True)
+            if attempt == self.max_retries:
+                return response
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                self.rate_limiter.pause(host, retry_after)
+            time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after))
+
+    def _send(self, url, **kwargs):
+        """
+        Send a single request, holding one of the host's in-flight slots
+        """
+        slots = self._slots_for(url)
+        if slots is None:
+            return self.session.get(url, **kwargs)
+        with slots:
+            return self.session.get(url, **kwargs)
+
+    def _slots_for(self, url):
+        """
+        Return the semaphore capping concurrent requests to the url's host
+        """
+        if self.max_per_host is None:
+            return None
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def close(self):
+        """
+        Close all pooled connections
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHttpClient:
+    """
+    asyncio counterpart of HttpClient built on aiohttp.
+
+    A single aiohttp session with a connection pool capped per host serves every
+    coroutine, so thousands of requests can be in flight on one event loop.
+    Responses are returned as requests.Response objects so the parsing code is
+    shared with the synchronous fetchers. Pacing and retries follow HttpClient.
+    """
+
+    def __init__(self, limit=200, max_per_host=16, timeout=30,
+                 rate_limiter=None, max_retries=4, backoff_base=0.5, backoff_max=60.0, cache=None):
+        """
+        Args:
+            limit (int): Maximum number of open connections in total
+            max_per_host (int, optional): Maximum number of open connections per host.
+                                          None disables the cap.
+            timeout (float): Default request timeout in seconds
+            rate_limiter (RateLimiter, optional): Per-host pacing. Defaults to RateLimiter().
+            max_retries (int): Retries after a 429/5xx response or connection error
+            backoff_base (float): First backoff delay in seconds, doubled on every retry
+            backoff_max (float): Upper bound for a single backoff delay in seconds
+            cache (ResponseCache, optional): On-disk response cache. None disables caching.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncHttpClient requires aiohttp: pip install 'vbdb-data[async]'")
+        self.limit = limit
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self._session = None
+        self._loop = None
+
+    def _get_session(self):
+        """
+        Return the aiohttp session, creating it on the running event loop
+
+        A session only works on the loop it was created on, so a new one is made
+        when the client is used from another loop, e.g. a second asyncio.run().
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._discard_session()
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.max_per_host or 0)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+        return self._session
+
+    def _discard_session(self):
+        """
+        Drop a session left on another event loop, closing its connections
+        """
+        session = self._session
+        self._session = self._loop = None
+        if session is not None and not session.closed:
+            # Its loop has finished, so the close can't be awaited any more
+            connector = session.connector
+            session.detach()
+            connector._close()
+
+    async def get(self, url, headers=None, params=None, ttl=None):
+        """
+        Issue a GET request through the pooled aiohttp session
+
+        Args:
+            url (str): Url to fetch
+            headers (dict, optional): Extra request headers
+            params (dict, optional): Query string parameters
+            ttl (float, optional): Cache TTL in seconds for this url, overriding the
+                                   cache's url rules (http_cache.FOREVER never expires)
+
+        Returns:
+            requests.Response: The fully read response
+        """
+        if self.cache is None:
+            return await self._fetch(url, headers=headers, params=params)
+
+        key = self.cache.key(url, params)
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if self.cache.is_fresh(entry, ttl):
+                return cached_response(self.cache, entry)
+            headers = {**(headers or {}), **self.cache.conditional_headers(entry)}
+
+        response = await self._fetch(url, headers=headers, params=params)
+        return update_cache(self.cache, key, entry, response)
+
+    async def _fetch(self, url, headers=None, params=None):
+        """
+        Send a request with rate limiting and retries
+        """
+        host = urlparse(url).netloc
+
+        for attempt in range(self.max_retries + 1):
+            await asyncio.sleep(self.rate_limiter.reserve(host))
+            try:
+                response = await self._send(url, headers=headers, params=params)
+            except (aiohttp.ClientConnectionError, TimeoutError):
+                self.rate_limiter.record(host, throttled=True)
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+                continue
+
+            if response.status_code not in RETRY_STATUSES:
+                self.rate_limiter.record(host, throttled=False)
+                return response
+
+            self.rate_limiter.record(host, throttled=True)
+            if attempt == self.max_retries:
+                return response
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                self.rate_limiter.pause(host, retry_after)
+            await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after))
+
+    async def _send(self, url, headers=None, params=None):
+        """
+        Send a single request and read the whole body
+        """
+        session = self._get_session()
+        async with session.get(url, headers=headers, params=params) as response:
+            content = await response.read()
+            return build_response(str(response.url), response.status, response.headers, content)
+
+    async def close(self):
+        """
+        Close the aiohttp session and its connections
+        """
+        if self._session is not None:
+            await self._session.close()
+        self._session = self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delta seconds or HTTP date) into seconds, or None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base, cap, retry_after=None):
+    """
+    Exponential backoff with full jitter, never shorter than Retry-After
+
+    Args:
+        attempt (int): Zero-based retry attempt
+        base (float): First backoff delay in seconds
+        cap (float): Upper bound for the exponential delay in seconds
+        retry_after (float, optional): Delay requested by the server in seconds
+
+    Returns:
+        float: Seconds to wait before retrying
+    """
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def cached_response(cache, entry):
+    """
+    Build a response from a cache entry
+    """
+    status_code, headers, content = cache.load(entry)
+    return build_response(entry['key'], status_code, headers, content)
+
+
+def update_cache(cache, key, entry, response):
+    """
+    Store a fresh 200 response, or serve the cached body for a 304 Not Modified
+
+    Args:
+        cache (ResponseCache): The cache
+        key (str): Cache key of the request
+        entry (dict, optional): Entry that was revalidated, if any
+        response (requests.Response): Response from the server
+
+    Returns:
+        requests.Response: The response callers should see
+    """
+    if response.status_code == 304 and entry is not None:
+        return cached_response(cache, cache.touch(entry))
+    if response.status_code == 200:
+        cache.store(key, response.status_code, response.headers, response.content)
+    return response
+
+
+def build_response(url, status_code, headers, content):
+    """
+    Build a requests.Response from an already downloaded body
+
+    Args:
+        url (str): Final url of the response
+        status_code (int): HTTP status code
+        headers (Mapping): Response headers
+        content (bytes): Response body
+
+    Returns:
+        requests.Response: The response
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Return the process-wide shared HttpClient, creating it on first use
+
+    Responses are cached on disk when the VBDB_CACHE_DIR environment variable is set.
+
+    Returns:
+        HttpClient: The shared client
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            cache_dir = os.environ.get('VBDB_CACHE_DIR')
+            _default_client = HttpClient(cache=ResponseCache(cache_dir) if cache_dir else None)
+        return _default_client
@@ -0,0 +1,128 @@
+import os
+import uuid
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Only needed by PlayByPlayWriter (pip install vbdb-data[parquet])
+    pa = None
+    pq = None
+
+
+def pbp_schema():
+    """
+    Arrow schema of the play-by-play dataset
+
+    Low-cardinality text columns are dictionary (categorical) encoded.
+    """
+    categorical = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('match_id', pa.string()),
+        ('set_number', pa.int64()),
+        ('skill', categorical),
+        ('player', categorical),
+        ('play', pa.string()),
+        ('school', categorical),
+        ('score', pa.string()),
+        ('short_play_text', pa.string()),
+        ('grade', categorical),
+    ])
+
+
+# Hive's partition value for a missing key, read back as null
+UNKNOWN_DIVISION = '__HIVE_DEFAULT_PARTITION__'
+
+
+class PlayByPlayWriter:
+    """
+    Append play-by-play frames to a Parquet dataset partitioned by season and division.
+
+    Each match is written as its own row group as soon as it is parsed, so a
+    season never has to be held in memory. Every division gets its own file,
+    laid out hive-style:
+
+        <path>/season=2024-25/division=I/part-<id>.parquet
+
+    and the whole dataset reads back with pandas.read_parquet(path), with season
+    and division as columns. School, skill, player and grade are categorical.
+
+    Files are only complete once close() is called. Writing again after close()
+    starts new part files, so one writer can be reused across batches.
+    """
+
+    def __init__(self, path, season, division=None):
+        """
+        Args:
+            path (str): Dataset root directory
+            season (str): Season year format '2024-25'
+            division (str, optional): Division of matches written without one ('I', 'II', 'III').
+                                      Matches with no division at all go to the null partition.
+        """
+        if pa is None:
+            raise ImportError("PlayByPlayWriter requires pyarrow: pip install 'vbdb-data[parquet]'")
+
+        self.schema = pbp_schema()
+        self.path = path
+        self.season = season
+        self.division = division
+        self.matches = 0
+        self.rows = 0
+        self._writers = {}
+
+    def write(self, df, division=None):
+        """
+        Append one match's plays as a row group
+
+        Args:
+            df (pandas.DataFrame): Plays from parse_volleyball_pbp
+            division (str, optional): Division of the match, defaults to the writer's division
+        """
+        if df is None or df.empty:
+            return
+
+        columns = {}
+        for field in self.schema:
+            values = df[field.name] if field.name in df else pd.Series([None] * len(df))
+            if field.name == 'match_id':
+                values = values.astype(str)
+            columns[field.name] = pa.array(values.tolist(), type=field.type, from_pandas=True)
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+
+        self._writer_for(division or self.division or UNKNOWN_DIVISION).write_table(table)
+        self.matches += 1
+        self.rows += len(df)
+
+    def _writer_for(self, division):
+        """
+        Return the open ParquetWriter of a division partition, opening a new part file if needed
+        """
+        writer = self._writers.get(division)
+        if writer is None:
+            directory = os.path.join(self.path, f"season={self.season}", f"division={division}")
+            os.makedirs(directory, exist_ok=True)
+            writer = pq.ParquetWriter(os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet"), self.schema)
+            self._writers[division] = writer
+        return writer
+
+    def close(self):
+        """
+        Finish every open Parquet file
+
+        Returns:
+            list[str]: Paths of the files finished, one per division written since
+                       the last close, or None if nothing was written
+        """
+        paths = []
+        for writer in self._writers.values():
+            writer.close()
+            paths.append(writer.where)
+        self._writers = {}
+        return paths or None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
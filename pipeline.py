@@ -0,0 +1,186 @@
+import argparse
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from fetch_all_players import save_players, stream_players
+from fetch_all_teams import build_all_teams, save_all_teams
+from fetch_lovb import LOVB
+from fetch_lovb_results import is_final, load_matches as load_lovb_matches, merge_matches as merge_lovb_matches
+from fetch_lovb_results import save_matches as save_lovb_matches
+from fetch_ncaa import NCAA
+from fetch_pvf import PVF
+from fetch_pvf_results import save_matches as save_pvf_matches
+from fetch_results import combine_results, fetch_gender_results, load_previous_results
+
+
+# Output stages, one per file under data/
+TARGETS = ['teams', 'players', 'ncaa_results', 'lovb_results', 'pvf_results']
+
+
+def build_stages(year='2024-25', workers=16, incremental=False):
+    """
+    Build the pipeline DAG.
+
+    Each stage is name -> (dependency names, function). A stage's function is
+    called with its dependencies' artifacts as keyword arguments and returns
+    its own artifact. Upstream fetches (team directories, team lists) are
+    separate stages so every output that needs them shares a single fetch.
+    With incremental=True the NCAA results stages start from the saved results
+    and only refetch teams with pending or recent games, and new LOVB matches
+    are merged into the saved ones. Saved LOVB matches that are final always
+    reuse their VolleyStation links.
+    """
+    ncaa_w = NCAA('W')
+    ncaa_m = NCAA('M')
+    lovb = LOVB()
+    pvf = PVF()
+
+    return {
+        # Shared upstream inputs
+        'ncaa_w_teams': ([], lambda: ncaa_w.fetch_ncaa_teams()),
+        'ncaa_m_teams': ([], lambda: ncaa_m.fetch_ncaa_teams()),
+        'lovb_teams': ([], lambda: lovb.fetch_teams()),
+        'pvf_teams': ([], lambda: pvf.fetch_teams()),
+        'ncaa_previous_results': ([], lambda: load_previous_results() if incremental else None),
+        'lovb_previous_results': ([], lambda: load_lovb_matches()),
+
+        # Intermediate artifacts
+        'lovb_roster': (['lovb_teams'], lambda lovb_teams: lovb.fetch_rosters(teams=lovb_teams)),
+        'pvf_roster': (['pvf_teams'], lambda pvf_teams: pvf.fetch_players(teams=pvf_teams)),
+        'ncaa_w_results': (
+            ['ncaa_w_teams', 'ncaa_previous_results'],
+            lambda ncaa_w_teams, ncaa_previous_results: fetch_gender_results(
+                'W', year, workers, ncaa=ncaa_w, teams=ncaa_w_teams, previous=ncaa_previous_results
+            ),
+        ),
+        'ncaa_m_results': (
+            ['ncaa_m_teams', 'ncaa_previous_results'],
+            lambda ncaa_m_teams, ncaa_previous_results: fetch_gender_results(
+                'M', year, workers, ncaa=ncaa_m, teams=ncaa_m_teams, previous=ncaa_previous_results
+            ),
+        ),
+        'lovb_matches': (
+            ['lovb_previous_results'],
+            lambda lovb_previous_results: lovb.get_matches_with_logos(
+                known=[match for match in lovb_previous_results if is_final(match)]
+            ),
+        ),
+        'pvf_matches': ([], lambda: pvf.fetch_schedule(when='past')),
+
+        # Outputs
+        'teams': (
+            ['lovb_teams', 'pvf_teams', 'ncaa_m_teams', 'ncaa_w_teams'],
+            lambda lovb_teams, pvf_teams, ncaa_m_teams, ncaa_w_teams: save_all_teams(
+                build_all_teams(lovb_teams, pvf_teams, ncaa_m_teams, ncaa_w_teams)
+            ),
+        ),
+        # NCAA rosters are streamed straight to the file as teams finish
+        'players': (
+            ['lovb_roster', 'pvf_roster'],
+            lambda lovb_roster, pvf_roster: save_players(
+                stream_players(lovb_roster, pvf_roster, ncaa_m.iter_players(workers), ncaa_w.iter_players(workers))
+            ),
+        ),
+        'ncaa_results': (
+            ['ncaa_w_results', 'ncaa_m_results'],
+            lambda ncaa_w_results, ncaa_m_results: combine_results(ncaa_w_results, ncaa_m_results),
+        ),
+        'lovb_results': (
+            ['lovb_matches', 'lovb_previous_results'],
+            lambda lovb_matches, lovb_previous_results: save_lovb_matches(
+                merge_lovb_matches(lovb_previous_results, lovb_matches) if incremental else lovb_matches
+            ),
+        ),
+        'pvf_results': (['pvf_matches'], lambda pvf_matches: save_pvf_matches(pvf_matches)),
+    }
+
+
+def required_stages(stages, targets):
+    """
+    Return the targets and everything they depend on
+    """
+    needed = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name in needed:
+            continue
+        if name not in stages:
+            raise ValueError(f"Unknown stage: {name}")
+        needed.add(name)
+        pending.extend(stages[name][0])
+    return needed
+
+
+def run_pipeline(targets=None, max_parallel=4, year='2024-25', workers=16, incremental=False):
+    """
+    Run the requested output stages and their dependencies.
+
+    Every stage runs exactly once. Stages whose dependencies are done run in
+    parallel, so independent sources such as LOVB and PVF don't wait on each other.
+    A failed stage skips the stages that depend on it but not the rest.
+
+    Args:
+        targets (list, optional): Output stages to produce. Defaults to TARGETS.
+        max_parallel (int): Number of stages run at the same time
+        year (str): NCAA season year format '2024-25'
+        workers (int): Teams fetched at the same time inside the NCAA results stages
+        incremental (bool): Refresh the saved NCAA and LOVB results instead of rebuilding them
+
+    Returns:
+        tuple[dict, dict]: Artifacts by stage name, and errors by stage name
+    """
+    stages = build_stages(year=year, workers=workers, incremental=incremental)
+    needed = required_stages(stages, targets or TARGETS)
+
+    artifacts = {}
+    errors = {}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while True:
+            # Skip stages whose dependencies failed
+            for name in sorted(needed - set(artifacts) - set(errors) - set(running.values())):
+                failed = [dep for dep in stages[name][0] if dep in errors]
+                if failed:
+                    errors[name] = f"skipped, upstream failed: {', '.join(failed)}"
+
+            # Start every stage whose dependencies are done
+            for name in sorted(needed - set(artifacts) - set(errors) - set(running.values())):
+                deps, func = stages[name]
+                if all(dep in artifacts for dep in deps):
+                    print(f"[pipeline] starting {name}")
+                    future = executor.submit(func, **{dep: artifacts[dep] for dep in deps})
+                    running[future] = name
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    artifacts[name] = future.result()
+                    print(f"[pipeline] finished {name}")
+                except Exception as e:
+                    errors[name] = f"{type(e).__name__}: {e}"
+                    print(f"[pipeline] {name} failed: {errors[name]}")
+
+    return artifacts, errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch all vbdb data in one dependency-aware run")
+    parser.add_argument('targets', nargs='*', choices=TARGETS, help="Outputs to produce (default: all)")
+    parser.add_argument('--parallel', type=int, default=4, help="Stages run at the same time")
+    parser.add_argument('--year', default='2024-25', help="NCAA season, e.g. 2024-25")
+    parser.add_argument('--workers', type=int, default=16, help="Concurrent teams per NCAA results stage")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Refresh the saved NCAA and LOVB results instead of rebuilding them")
+    args = parser.parse_args()
+
+    _, errors = run_pipeline(args.targets or None, max_parallel=args.parallel, year=args.year, workers=args.workers,
+                             incremental=args.incremental)
+    for name, error in errors.items():
+        print(f"Stage {name} failed: {error}")
+    sys.exit(1 if errors else 0)
@@ -0,0 +1,192 @@
+import html
+import json
+import re
+
+
+# Next.js streams the React Server Components (RSC) "flight" payload into the
+# page as script tags calling self.__next_f.push([1, "<chunk>"])
+FLIGHT_CHUNK = re.compile(r'self\.__next_f\.push\(\[1,\s*("(?:[^"\\]|\\.)*")\]\)', re.S)
+ROW_ID = re.compile(rb'([0-9a-f]+):')
+ROW_TAG = re.compile(r'^[A-Z]+(?=[\[{"])')
+# "$1f" row, "$L1f" lazy component and "$@1f" promise references
+REFERENCE = re.compile(r'^\$[L@]?([0-9a-f]+)$')
+
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+ATTRIBUTE_NAMES = {'className': 'class', 'htmlFor': 'for'}
+
+
+def extract_flight(markup):
+    """
+    Join the RSC flight chunks embedded in a Next.js page
+
+    Args:
+        markup (str): Page HTML
+
+    Returns:
+        str: The flight payload, empty if the page has none
+    """
+    return ''.join(json.loads(chunk) for chunk in FLIGHT_CHUNK.findall(markup))
+
+
+def parse_flight(flight):
+    """
+    Split a flight payload into its rows
+
+    Rows look like `<hex id>:<json>` terminated by a newline, or
+    `<hex id>:T<hex length>,<text>` for long strings, whose length is in UTF-8
+    bytes and which are not newline terminated. Rows with a type tag before the
+    JSON (I for client module references, HL for hints, E for errors...) hold no
+    page content and are skipped.
+
+    Args:
+        flight (str): Payload from extract_flight
+
+    Returns:
+        dict: Row id -> decoded JSON value, text, or raw string if undecodable
+    """
+    data = flight.encode('utf-8')
+    rows = {}
+    position = 0
+    while position < len(data):
+        match = ROW_ID.match(data, position)
+        if not match:
+            # Not a row start, skip to the next line
+            end = data.find(b'\n', position)
+            position = len(data) if end < 0 else end + 1
+            continue
+
+        row_id = match.group(1).decode()
+        position = match.end()
+
+        if data[position:position + 1] == b'T':
+            comma = data.index(b',', position)
+            length = int(data[position + 1:comma], 16)
+            rows[row_id] = data[comma + 1:comma + 1 + length].decode('utf-8', errors='replace')
+            position = comma + 1 + length
+            continue
+
+        end = data.find(b'\n', position)
+        end = len(data) if end < 0 else end
+        payload = data[position:end].decode('utf-8', errors='replace')
+        position = end + 1
+        if ROW_TAG.match(payload):
+            continue
+        try:
+            rows[row_id] = json.loads(payload)
+        except ValueError:
+            rows[row_id] = payload
+    return rows
+
+
+def render_html(node, rows, depth=0):
+    """
+    Render an RSC element tree back to HTML markup
+
+    Host elements (["$", "div", key, props]) become tags with their string
+    props as attributes. Client components and fragments contribute only their
+    children, "$<id>" / "$L<id>" references are followed into other rows, and
+    element trees nested in router state objects are rendered in order.
+
+    Args:
+        node: Decoded flight value
+        rows (dict): All rows from parse_flight, for resolving references
+        depth (int): Reference depth, guards against cycles
+
+    Returns:
+        str: HTML markup
+    """
+    if depth > 50:
+        return ''
+
+    if isinstance(node, str):
+        if node.startswith('$$'):
+            return html.escape(node[1:])
+        if node.startswith('$'):
+            reference = REFERENCE.match(node)
+            if reference and reference.group(1) in rows:
+                return render_html(rows[reference.group(1)], rows, depth + 1)
+            return ''
+        return html.escape(node)
+
+    if isinstance(node, bool) or node is None:
+        return ''
+    if isinstance(node, (int, float)):
+        return str(node)
+
+    if isinstance(node, list):
+        if len(node) == 4 and node[0] == '$' and isinstance(node[3], dict):
+            return _render_element(node[1], node[3], rows, depth)
+        return ''.join(render_html(child, rows, depth) for child in node)
+
+    # Router state objects (such as the root row) wrap element trees in lists
+    if isinstance(node, dict):
+        return ''.join(render_html(value, rows, depth) for value in node.values() if isinstance(value, list))
+
+    return ''
+
+
+def _render_element(element_type, props, rows, depth):
+    children = render_html(props.get('children'), rows, depth)
+    inner = props.get('dangerouslySetInnerHTML')
+    if isinstance(inner, dict) and isinstance(inner.get('__html'), str):
+        children = inner['__html']
+
+    # Client component, fragment or reference: only its children render
+    if not isinstance(element_type, str) or element_type.startswith('$') or not element_type[:1].islower():
+        return children
+
+    attributes = []
+    for name, value in props.items():
+        if name in ('children', 'dangerouslySetInnerHTML', 'style') or isinstance(value, (dict, list, bool)) or value is None:
+            continue
+        if isinstance(value, str) and value.startswith('$'):
+            continue
+        attributes.append(f' {ATTRIBUTE_NAMES.get(name, name)}="{html.escape(str(value))}"')
+
+    if element_type in VOID_ELEMENTS:
+        return f"<{element_type}{''.join(attributes)}>"
+    return f"<{element_type}{''.join(attributes)}>{children}</{element_type}>"
+
+
+def _references(value, found):
+    """
+    Collect the row ids referenced anywhere inside a decoded value
+    """
+    if isinstance(value, str):
+        reference = REFERENCE.match(value)
+        if reference:
+            found.add(reference.group(1))
+    elif isinstance(value, list):
+        for item in value:
+            _references(item, found)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _references(item, found)
+    return found
+
+
+def rsc_html(markup):
+    """
+    Rebuild the server-rendered markup of a Next.js page from its RSC payload
+
+    Useful when the initial HTML holds only a loading shell and the content is
+    streamed in the flight payload instead.
+
+    Args:
+        markup (str): Page HTML
+
+    Returns:
+        str: HTML rendered from every root row, i.e. one no other row references
+    """
+    rows = parse_flight(extract_flight(markup))
+    referenced = set()
+    for value in rows.values():
+        _references(value, referenced)
+
+    parts = []
+    for row_id, value in rows.items():
+        if row_id in referenced:
+            continue
+        if isinstance(value, (list, dict)):
+            parts.append(render_html(value, rows))
+    return ''.join(parts)
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import requests
+
+from fetch_lovb import LOVB
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+TEAMS = [{'roster': 'https://www.lovb.com/teams/lovb-atlanta-volleyball/roster'}]
+
+
+class FixtureClient:
+    """Serves one saved page for every url"""
+
+    def __init__(self, name):
+        self.content = (FIXTURES / name).read_bytes()
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.content
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+
+def fetch_rosters(page):
+    lovb = LOVB(client=FixtureClient(page), browsers=object(), backend='http')
+    return lovb.fetch_rosters(TEAMS), lovb.readiness
+
+
+def test_roster_only_in_the_rsc_payload_matches_the_static_page():
+    static, _ = fetch_rosters('lovb_roster.html')
+    streamed, readiness = fetch_rosters('lovb_roster_rsc.html')
+    assert len(static) == 4
+    assert streamed == static
+    assert [entry['backend'] for entry in readiness] == ['http']
@@ -0,0 +1,238 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+import requests
+
+from fetch_ncaa import FOREVER, NCAA, contest_ttl, current_season
+from http_cache import ResponseCache
+
+
+def test_contest_pages_of_completed_seasons_never_expire():
+    assert contest_ttl('2020-21') == FOREVER
+
+
+def test_current_season_and_unknown_contests_revalidate():
+    assert contest_ttl(current_season()) is None
+    assert contest_ttl('4123456') is None
+    assert contest_ttl(None) is None
+
+
+def test_contest_pages_have_no_blanket_ttl(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    assert cache.ttl_for('https://stats.ncaa.org/contests/123/box_score') == 0
+
+
+class CountingReference:
+    def __init__(self):
+        self.calls = []
+
+    def team_codes(self, refresh=False, ttl=None):
+        self.calls.append(('team_codes', refresh, ttl))
+        return pd.DataFrame({0: ['1'], 1: ['Alpha']})
+
+    def member_list(self, gender, refresh=False, ttl=None):
+        self.calls.append(('member_list', refresh, ttl))
+        return [{'orgId': 1, 'nameOfficial': 'Alpha University', 'divisionRoman': 'I',
+                 'athleticWebUrl': 'alpha.edu', 'conferenceName': 'Big Ten'}]
+
+
+def test_teams_ttl_is_passed_to_the_reference():
+    reference = CountingReference()
+    ncaa = NCAA('W', teams_ttl=60, reference=reference)
+    ncaa.fetch_ncaa_teams()
+    ncaa.fetch_ncaa_teams(refresh=True)
+    assert reference.calls == [
+        ('team_codes', False, 60), ('member_list', False, 60),
+        ('team_codes', True, 60), ('member_list', True, 60),
+    ]
+
+
+class SlowFirstTeam(NCAA):
+    """NCAA whose first team is slow and whose roster fetches are counted"""
+
+    def __init__(self, teams, release):
+        super().__init__('W', reference=CountingReference())
+        self.teams = teams
+        self.release = release
+        self.started = []
+
+    def _build_member_teams(self, json_data):
+        return pd.DataFrame({'team_id': self.teams})
+
+    def _fetch_team_players(self, team_id, teams_df):
+        self.started.append(team_id)
+        if team_id == self.teams[0]:
+            self.release.wait(5)
+        if team_id == 'bad':
+            raise ValueError('no roster')
+        return [{'team_id': team_id}]
+
+
+def test_iter_players_keeps_order_and_bounds_queued_teams():
+    release = threading.Event()
+    ncaa = SlowFirstTeam([str(i) for i in range(20)] + ['bad'], release)
+    players = ncaa.iter_players(workers=2)
+    threading.Timer(0.2, release.set).start()
+    assert next(players) == {'team_id': '0'}
+    # Only the window behind the slow first team was submitted meanwhile
+    assert len(ncaa.started) <= 4
+    rest = list(players)
+    assert [p['team_id'] for p in rest] == [str(i) for i in range(1, 20)]
+    assert list(ncaa.players_failures) == ['bad']
+
+
+def test_closing_iter_players_cancels_queued_teams():
+    release = threading.Event()
+    ncaa = SlowFirstTeam([str(i) for i in range(20)], release)
+    players = ncaa.iter_players(workers=2)
+    threading.Timer(0.2, release.set).start()
+    next(players)
+    players.close()
+    assert len(ncaa.started) < 20
+
+
+class BrokenSummary(NCAA):
+    def __init__(self):
+        super().__init__('W', reference=CountingReference())
+
+    def fetch_match_summary(self, match_id, ttl=None):
+        if match_id == '2':
+            raise ValueError('no score table')
+        return {'match_id': match_id}
+
+
+def test_one_failed_summary_does_not_fail_the_batch():
+    ncaa = BrokenSummary()
+    results = ncaa.fetch_contests(['1', '2', '3'], summary=True, workers=2)
+    assert results['summary'] == [{'match_id': '1'}, {'match_id': '3'}]
+    assert ncaa.summary_failures == {'2': 'ValueError: no score table'}
+
+
+def test_play_by_play_downloads_do_not_wait_for_parsing():
+    ncaa = NCAA('W', reference=CountingReference())
+    parses = {}
+    all_downloaded = threading.Event()
+
+    def download(match_id):
+        # Parse futures only complete once every page is downloaded
+        parses[match_id] = Future()
+        if len(parses) == 4:
+            all_downloaded.set()
+        return parses[match_id]
+
+    def parse_when_downloaded():
+        downloaded = all_downloaded.wait(5)
+        for match_id, future in list(parses.items()):
+            future.set_result(pd.DataFrame({'match_id': [match_id]}))
+        return downloaded
+
+    parser = ThreadPoolExecutor(max_workers=1).submit(parse_when_downloaded)
+    results = ncaa._run_contest_tasks(['1', '2', '3', '4'], ['pbp'], {'pbp': download}, workers=2)
+    assert parser.result()
+    assert list(results['pbp']['match_id']) == ['1', '2', '3', '4']
+
+
+def test_failed_play_by_play_parse_is_skipped():
+    ncaa = NCAA('W', reference=CountingReference())
+
+    def download(match_id):
+        future = Future()
+        if match_id == '2':
+            future.set_exception(ValueError('bad page'))
+        else:
+            future.set_result(pd.DataFrame({'match_id': [match_id]}))
+        return future
+
+    results = ncaa._run_contest_tasks(['1', '2', '3'], ['pbp'], {'pbp': download}, workers=2)
+    assert list(results['pbp']['match_id']) == ['1', '3']
+
+
+class RecordingWriter:
+    def __init__(self, release_after=None):
+        self.written = []
+        self.release = threading.Event()
+        self.release_after = release_after
+
+    def write(self, df, division=None):
+        self.written.append((df['match_id'].iloc[0], division))
+        if len(self.written) == self.release_after:
+            self.release.set()
+
+    def close(self):
+        return ['plays.parquet']
+
+
+def test_streamed_plays_are_written_in_completion_order():
+    ncaa = NCAA('W', reference=CountingReference())
+    # The first match is stuck until every other match has been written
+    writer = RecordingWriter(release_after=9)
+
+    def download(match_id):
+        if match_id == '0':
+            writer.release.wait(5)
+        return pd.DataFrame({'match_id': [match_id]})
+
+    match_ids = [str(i) for i in range(10)]
+    results = ncaa._run_contest_tasks(match_ids, ['pbp'], {'pbp': download}, workers=2,
+                                      pbp_writer=writer, divisions={'0': 'I', '5': 'II'})
+    assert writer.release.is_set()
+    assert writer.written[-1] == ('0', 'I')
+    assert ('5', 'II') in writer.written
+    assert sorted(match_id for match_id, _ in writer.written) == sorted(match_ids)
+    assert results['pbp'] == ['plays.parquet']
+
+
+HISTORY_PAGE = (
+    '<table><thead><tr><th>Year</th></tr></thead><tbody>'
+    '<tr><td><a href="/teams/1001">2024-25</a></td><td>Coach</td><td>I</td><td>Big Ten</td>'
+    '<td>20</td><td>5</td><td>0</td><td>.800</td><td></td></tr></tbody></table>'
+)
+
+
+class SlowHistoryClient:
+    """Serves the same history page after a delay, counting requests"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _response(self, url):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = HISTORY_PAGE.encode()
+        response.url = url
+        return response
+
+    def get(self, url, **kwargs):
+        time.sleep(0.1)
+        return self._response(url)
+
+
+class SlowHistoryAsyncClient(SlowHistoryClient):
+    async def get(self, url, **kwargs):
+        await asyncio.sleep(0.1)
+        return self._response(url)
+
+
+def test_team_history_is_downloaded_once_by_concurrent_callers():
+    client = SlowHistoryClient()
+    ncaa = NCAA('W', client=client, reference=CountingReference())
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        histories = list(executor.map(lambda _: ncaa.team_history('1'), range(4)))
+    assert client.calls == 1
+    assert all(rows is histories[0] for rows in histories)
+
+
+def test_team_history_async_is_downloaded_once_by_concurrent_callers():
+    async_client = SlowHistoryAsyncClient()
+    ncaa = NCAA('W', client=SlowHistoryClient(), async_client=async_client, reference=CountingReference())
+
+    async def run():
+        return await asyncio.gather(*(ncaa.team_history_async('1') for _ in range(4)))
+
+    histories = asyncio.run(run())
+    assert async_client.calls == 1
+    assert histories[0][0]['season_id'] == '1001'
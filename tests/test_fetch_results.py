@@ -0,0 +1,42 @@
+from datetime import date
+
+import pandas as pd
+
+from fetch_results import teams_to_refresh
+
+
+def results(rows):
+    return pd.DataFrame(rows, columns=['team_id', 'date', 'result'])
+
+
+def test_doubleheader_date_with_pending_result_is_refetched():
+    previous = results([
+        ('1', '09/05/2024(1)', ''),
+        ('1', '09/01/2024', 'W 3-0'),
+        ('2', '09/01/2024', 'W 3-1'),
+    ])
+    assert teams_to_refresh(previous, ['1', '2'], today=date(2024, 10, 1)) == ['1']
+
+
+def test_unparseable_date_with_pending_result_is_refetched():
+    previous = results([('1', 'TBA', ''), ('2', '09/01/2024', 'L 0-3')])
+    assert teams_to_refresh(previous, ['1', '2'], today=date(2024, 10, 1)) == ['1']
+
+
+def test_future_games_without_results_are_not_refetched():
+    previous = results([
+        ('1', '09/01/2024', 'W 3-0'),
+        ('1', '11/01/2024', ''),
+        ('2', '09/01/2024', 'W 3-1'),
+        ('2', '09/30/2024', ''),
+    ])
+    assert teams_to_refresh(previous, ['1', '2'], today=date(2024, 10, 15)) == ['2']
+
+
+def test_recent_and_unknown_teams_are_refetched():
+    previous = results([
+        ('1', '10/14/2024', 'W 3-0'),
+        ('2', '09/01/2024', 'W 3-1'),
+        ('3', '09/01/2023', 'W 3-1'),
+    ])
+    assert teams_to_refresh(previous, ['1', '2', '3', '4'], today=date(2024, 10, 15)) == ['1', '3', '4']
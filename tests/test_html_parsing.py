@@ -0,0 +1,74 @@
+"""
+Parser parity: every scraper must read the same data from a page whether it is
+parsed with lxml (the default) or the pure-Python html.parser.
+"""
+import importlib
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+import html_parsing
+from fetch_lovb import LOVB
+from fetch_ncaa import NCAA, parse_volleyball_pbp
+from html_parsing import make_soup
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+PARSERS = ('lxml', 'html.parser')
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_bytes()
+
+
+def parse_with(monkeypatch, parser, func, *args):
+    monkeypatch.setattr(html_parsing, 'PARSER', parser)
+    return func(*args)
+
+
+class FixtureClient:
+    """Serves the saved LOVB roster page for every url"""
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = read_fixture('lovb_roster.html')
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
+
+
+def test_lxml_is_the_default_parser(monkeypatch):
+    monkeypatch.delenv('VBDB_HTML_PARSER', raising=False)
+    try:
+        assert importlib.reload(html_parsing).PARSER == 'lxml'
+    finally:
+        importlib.reload(html_parsing)
+
+
+def test_play_by_play_is_parser_independent(monkeypatch):
+    page = read_fixture('ncaa_play_by_play.html')
+    lxml_plays, python_plays = (parse_with(monkeypatch, parser, parse_volleyball_pbp, page, '7') for parser in PARSERS)
+    assert len(lxml_plays) > 0
+    pd.testing.assert_frame_equal(lxml_plays, python_plays)
+
+
+def test_match_summary_is_parser_independent(monkeypatch):
+    ncaa = NCAA('W', reference=object())
+    page = read_fixture('ncaa_box_score.html')
+    summaries = [
+        parse_with(monkeypatch, parser, lambda: ncaa._parse_match_summary(make_soup(page), '7'))
+        for parser in PARSERS
+    ]
+    assert summaries[0] is not None
+    assert summaries[0] == summaries[1]
+
+
+def test_lovb_roster_is_parser_independent(monkeypatch):
+    teams = [{'roster': 'https://www.lovb.com/teams/lovb-atlanta-volleyball/roster'}]
+    rosters = []
+    for parser in PARSERS:
+        lovb = LOVB(client=FixtureClient(), browsers=object(), backend='http')
+        rosters.append(parse_with(monkeypatch, parser, lovb.fetch_rosters, teams))
+    assert len(rosters[0]) == 4
+    assert rosters[0] == rosters[1]
@@ -0,0 +1,61 @@
+import time
+
+from http_cache import FOREVER, ResponseCache
+from http_client import HttpClient, build_response
+
+URL = 'https://stats.ncaa.org/teams/history/WVB/1'
+
+
+class RecordingSession:
+    """Answers with the given (status, headers, body) in turn, recording request headers"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.headers.append(headers or {})
+        status, response_headers, body = self.responses.pop(0)
+        return build_response(url, status, response_headers, body)
+
+
+def cached_client(tmp_path, *responses):
+    client = HttpClient(cache=ResponseCache(str(tmp_path)))
+    client.session = RecordingSession(*responses)
+    return client
+
+
+def test_store_and_lookup(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    entry = cache.store(URL, 200, {'ETag': '"v1"', 'Content-Type': 'text/html', 'Set-Cookie': 'x'}, b'<html>')
+    assert cache.lookup(URL) == entry
+    assert cache.load(entry) == (200, {'ETag': '"v1"', 'Content-Type': 'text/html'}, b'<html>')
+    assert cache.conditional_headers(entry) == {'If-None-Match': '"v1"'}
+    assert cache.lookup('https://stats.ncaa.org/other') is None
+
+
+def test_forever_never_goes_stale(tmp_path):
+    cache = ResponseCache(str(tmp_path), default_ttl=0)
+    entry = dict(cache.store('https://stats.ncaa.org/contests/1/box_score', 200, {}, b'x'), fetched_at=0)
+    assert cache.is_fresh(entry, ttl=FOREVER)
+    assert not cache.is_fresh(entry)
+
+
+def test_fresh_entries_are_served_without_a_request(tmp_path):
+    client = cached_client(tmp_path, (200, {'ETag': '"v1"'}, b'history'))
+    assert client.get(URL).content == b'history'
+    assert client.get(URL).content == b'history'
+    assert len(client.session.headers) == 1
+
+
+def test_stale_entries_are_revalidated_and_304_serves_the_cached_body(tmp_path):
+    client = cached_client(tmp_path, (200, {'ETag': '"v1"'}, b'history'), (304, {}, b''))
+    client.get(URL, ttl=0)
+    before = client.cache.lookup(URL)['fetched_at']
+    time.sleep(0.01)
+
+    response = client.get(URL, ttl=0)
+    assert client.session.headers[-1]['If-None-Match'] == '"v1"'
+    assert response.status_code == 200
+    assert response.content == b'history'
+    assert client.cache.lookup(URL)['fetched_at'] > before
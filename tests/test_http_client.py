@@ -0,0 +1,160 @@
+import asyncio
+import http.server
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from fetch_ncaa import NCAA
+from http_cache import ResponseCache
+from http_client import AsyncHttpClient, HttpClient, RateLimiter, backoff_delay, build_response, parse_retry_after
+
+URL = 'https://stats.ncaa.org/contests/1/box_score'
+HOST = 'stats.ncaa.org'
+
+
+class OkHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_url():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_survives_a_new_event_loop(local_url):
+    pytest.importorskip('aiohttp')
+    client = AsyncHttpClient()
+
+    async def fetch(close=False):
+        response = await client.get(local_url)
+        if close:
+            await client.close()
+        return response.text
+
+    assert asyncio.run(fetch()) == 'ok'
+    assert asyncio.run(fetch(close=True)) == 'ok'
+
+
+def test_ncaa_async_client_shares_cache_and_pacing(tmp_path):
+    pytest.importorskip('aiohttp')
+    client = HttpClient(cache=ResponseCache(str(tmp_path)), rate_limiter=RateLimiter(rate=2))
+
+    async def run():
+        async with NCAA('W', client=client, reference=object()) as ncaa:
+            async_client = ncaa._get_async_client()
+            async_client._get_session()
+        return async_client
+
+    async_client = asyncio.run(run())
+    assert async_client.cache is client.cache
+    assert async_client.rate_limiter is client.rate_limiter
+    assert async_client._session is None
+
+
+class StubSession:
+    """Answers with the given statuses in turn, repeating the last one"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        response = self.responses[min(self.calls, len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        status, headers = response
+        return build_response(url, status, headers, b'body')
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, 'sleep', slept.append)
+    return slept
+
+
+def stub_client(*responses, max_retries=4):
+    client = HttpClient(rate_limiter=RateLimiter(rate=10, burst=20), max_retries=max_retries)
+    client.session = StubSession(*responses)
+    return client
+
+
+def test_429_is_retried_and_halves_the_rate(sleeps):
+    client = stub_client((429, {}), (200, {}))
+    response = client.get(URL)
+    assert response.status_code == 200
+    assert client.session.calls == 2
+    # Halved by the 429, then grown back by a twentieth of the maximum
+    assert client.rate_limiter.current_rate(HOST) == pytest.approx(5.5)
+    assert 0 <= sleeps[-1] <= client.backoff_base
+
+
+def test_retry_after_sets_the_wait_and_pauses_the_host(sleeps):
+    client = stub_client((429, {'Retry-After': '3'}), (200, {}))
+    assert client.get(URL).status_code == 200
+    assert 3 in sleeps
+    assert client.rate_limiter.reserve(HOST) == pytest.approx(3, abs=0.5)
+
+
+def test_retries_stop_after_max_retries(sleeps):
+    client = stub_client((503, {}), max_retries=2)
+    response = client.get(URL)
+    assert response.status_code == 503
+    assert client.session.calls == 3
+
+
+def test_connection_errors_are_raised_after_max_retries(sleeps):
+    client = stub_client(requests.ConnectionError('reset'), max_retries=1)
+    with pytest.raises(requests.ConnectionError):
+        client.get(URL)
+    assert client.session.calls == 2
+
+
+def test_rate_recovers_to_the_configured_rate():
+    limiter = RateLimiter(rate=10, min_rate=0.5)
+    for _ in range(10):
+        limiter.record(HOST, throttled=True)
+    assert limiter.current_rate(HOST) == 0.5
+    for _ in range(30):
+        limiter.record(HOST, throttled=False)
+    assert limiter.current_rate(HOST) == 10
+
+
+def test_reserve_paces_requests_beyond_the_burst():
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.reserve(HOST) == 0
+    assert limiter.reserve(HOST) == 0
+    assert limiter.reserve(HOST) == pytest.approx(0.1, abs=0.01)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('5') == 5
+    assert parse_retry_after('-2') == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(later) <= 60
+
+
+def test_backoff_delay_is_capped_and_respects_retry_after():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= 4
+    assert backoff_delay(0, base=0.5, cap=4, retry_after=30) == 30
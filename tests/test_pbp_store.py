@@ -0,0 +1,43 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from pbp_store import PlayByPlayWriter  # noqa: E402
+
+
+def plays(match_id, n=2):
+    return pd.DataFrame({
+        'match_id': [match_id] * n,
+        'set_number': [1] * n,
+        'skill': ['kill'] * n,
+        'player': ['Doe, J.'] * n,
+        'play': ['Kill by Doe, J.'] * n,
+        'school': ['Univ 1'] * n,
+        'score': ['1-0'] * n,
+        'short_play_text': ['K'] * n,
+        'grade': ['#'] * n,
+    })
+
+
+def test_matches_are_partitioned_by_their_division(tmp_path):
+    writer = PlayByPlayWriter(str(tmp_path), '2024-25')
+    writer.write(plays('1'), division='I')
+    writer.write(plays('2'), division='III')
+    writer.write(plays('3'), division='I')
+    paths = writer.close()
+
+    assert sorted(os.path.basename(os.path.dirname(path)) for path in paths) == ['division=I', 'division=III']
+    df = pd.read_parquet(str(tmp_path))
+    assert df.groupby('division', observed=True)['match_id'].apply(sorted).to_dict() == {
+        'I': ['1', '1', '3', '3'], 'III': ['2', '2'],
+    }
+
+
+def test_close_without_plays_returns_none(tmp_path):
+    writer = PlayByPlayWriter(str(tmp_path), '2024-25', 'I')
+    writer.write(pd.DataFrame())
+    assert writer.close() is None
+    assert not os.listdir(tmp_path)
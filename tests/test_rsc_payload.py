@@ -0,0 +1,34 @@
+import json
+
+from rsc_payload import extract_flight, parse_flight, render_html, rsc_html
+
+
+def test_text_rows_are_measured_in_utf8_bytes():
+    # "Jané" is 5 bytes, so the next row starts right after the é
+    rows = parse_flight('1:T5,Jané2:["$","p",null,{"children":"$1"}]\n')
+    assert rows['1'] == 'Jané'
+    assert rows['2'] == ['$', 'p', None, {'children': '$1'}]
+
+
+def test_tagged_rows_are_skipped():
+    rows = parse_flight('1:I["7391",["chunk.js"],"Table"]\n2:HL["/app.css","style"]\n3:"text"\n')
+    assert rows == {'3': 'text'}
+
+
+def test_chunks_are_joined_before_rows_are_split():
+    flight = '1:["$","b",null,{"children":"bold"}]\n'
+    markup = ''.join(
+        f'<script>self.__next_f.push([1,{json.dumps(chunk)}])</script>'
+        for chunk in (flight[:10], flight[10:])
+    )
+    assert extract_flight(markup) == flight
+    assert rsc_html(markup) == '<b>bold</b>'
+
+
+def test_references_client_components_and_escaping():
+    rows = parse_flight(
+        '1:I["7391",["chunk.js"],"Card"]\n'
+        '2:T3,a<b'
+        '0:["$","div",null,{"className":"card","children":["$","$L1",null,{"children":["$2","$$5",["$","br",null,{}]]}]}]\n'
+    )
+    assert render_html(rows['0'], rows) == '<div class="card">a&lt;b$5<br></div>'